@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import dspy
 import streamlit as st
@@ -49,12 +49,38 @@ def format_option_label(path: Path, payload: Dict[str, object]) -> str:
     return f"{name} ({payload.get('creator_identity', {}).get('handle', 'unknown')})"
 
 
+@st.cache_data(hash_funcs={Path: str})
+def build_profile(path: Path) -> InfluencerProfile:
+    return InfluencerProfileBuilder().build(load_snapshot(path))
+
+
+@st.cache_data
+def load_options(
+    fixture_paths: Tuple[Path, ...],
+) -> Dict[str, Tuple[Path, Dict[str, object]]]:
+    options: Dict[str, Tuple[Path, Dict[str, object]]] = {}
+    for path in fixture_paths:
+        payload = load_snapshot(path)
+        options[format_option_label(path, payload)] = (path, payload)
+    return options
+
+
+@st.cache_resource
+def fallback_lm() -> dspy.utils.DummyLM:
+    # Keyed on "" so every prompt matches: a list-backed DummyLM is exhausted after
+    # one answer, while this single instance can serve every rerun.
+    return dspy.utils.DummyLM({"": {"response": FALLBACK_IDEAS}})
+
+
 def ensure_language_model() -> str:
+    if dspy.settings.lm is fallback_lm():
+        return "Using fallback dummy responses"
+
     if configure_lm_from_env():
         return "Using configured language model"
 
     if dspy.settings.lm is None:
-        dspy.settings.configure(lm=dspy.utils.DummyLM([{"response": FALLBACK_IDEAS}]))
+        dspy.settings.configure(lm=fallback_lm())
         return "Using fallback dummy responses"
 
     return "Using existing language model"
@@ -103,6 +129,7 @@ def render_profile_sections(profile: InfluencerProfile) -> None:
             st.write("Integrations: " + ", ".join(ops["integrations"]))
 
 
+@st.fragment
 def render_idea_generation(profile: InfluencerProfile) -> None:
     st.subheader("Assistant: Video Idea Generator")
     ensure_status = ensure_language_model()
@@ -151,21 +178,12 @@ def main() -> None:
         st.error("No creator snapshot fixtures found.")
         return
 
-    builder = InfluencerProfileBuilder()
-
-    options = []
-    for path in fixture_paths:
-        payload = load_snapshot(path)
-        options.append((format_option_label(path, payload), path, payload))
+    options_by_label = load_options(tuple(fixture_paths))
 
-    selected_label = st.sidebar.selectbox(
-        "Select a creator snapshot", [label for label, _, _ in options]
-    )
-    selected_path, payload = next(
-        (p, data) for label, p, data in options if label == selected_label
-    )
+    selected_label = st.sidebar.selectbox("Select a creator snapshot", list(options_by_label))
+    selected_path, payload = options_by_label[selected_label]
 
-    profile = builder.build(payload)
+    profile = build_profile(selected_path)
 
     st.sidebar.markdown("### Snapshot metadata")
     st.sidebar.write(f"Creator ID: {profile.creator_id}")
@@ -23,13 +23,13 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator():
     observability = create_observability("eval-video-ideas", configure_lm=False)
     return VideoIdeaGenerator(observability=observability)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_profile():
     return InfluencerProfile(
         creator_id="test-001",
@@ -51,6 +51,18 @@ def test_profile():
     )
 
 
+@pytest.fixture(scope="module")
+def ideas_for_basic_request(generator, test_profile):
+    """Ideas for the generic request, generated once and shared across tests."""
+    return generator(profile=test_profile, request="Generate video ideas")
+
+
+@pytest.fixture(scope="module")
+def actual_output(ideas_for_basic_request):
+    """Idea lines for the generic request, formatted once for LLMTestCase input."""
+    return "\n".join(f"{i.title}: {i.summary}" for i in ideas_for_basic_request)
+
+
 def test_relevancy_to_request(generator, test_profile):
     """Video ideas should be relevant to the request."""
     ideas = generator(
@@ -69,12 +81,11 @@ def test_relevancy_to_request(generator, test_profile):
     assert_test(test_case, [metric])
 
 
-def test_faithfulness_to_profile(generator, test_profile):
+# Tests sharing the module-scoped generation run on one xdist worker
+# (`--dist=loadgroup`), so the basic-request LLM call is made only once.
+@pytest.mark.xdist_group("basic_request")
+def test_faithfulness_to_profile(actual_output, test_profile):
     """Ideas should be grounded in creator's content pillars."""
-    ideas = generator(profile=test_profile, request="Generate video ideas")
-
-    actual_output = "\n".join([f"{i.title}: {i.summary}" for i in ideas])
-
     retrieval_context = [
         f"Content pillars: {', '.join(test_profile.content_pillars)}",
         f"Niche: {test_profile.niche}",
@@ -91,12 +102,11 @@ def test_faithfulness_to_profile(generator, test_profile):
     assert_test(test_case, [metric])
 
 
-def test_pillar_adherence(generator, test_profile):
+@pytest.mark.xdist_group("basic_request")
+def test_pillar_adherence(ideas_for_basic_request, test_profile):
     """Generated ideas should map to content pillars."""
-    ideas = generator(profile=test_profile, request="Generate video ideas")
-
     # Check that each idea has a valid pillar
-    for idea in ideas:
+    for idea in ideas_for_basic_request:
         assert (
             idea.pillar in test_profile.content_pillars
         ), f"Idea pillar '{idea.pillar}' not in profile pillars {test_profile.content_pillars}"
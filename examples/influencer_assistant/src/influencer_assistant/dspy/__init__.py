@@ -1,13 +1,17 @@
 """DSPy-powered reasoning modules for the Influencer Assistant example."""
 
+from .batch import BatchIdeaGenerator
 from .config import configure_lm_from_env, reset_lm
 from .context import render_profile_context
+from .semantic_cache import SemanticIdeaCache
 from .video_ideas import VideoIdeaGenerator, VideoIdea
 
 __all__ = [
+    "BatchIdeaGenerator",
     "configure_lm_from_env",
     "render_profile_context",
     "reset_lm",
+    "SemanticIdeaCache",
     "VideoIdea",
     "VideoIdeaGenerator",
 ]
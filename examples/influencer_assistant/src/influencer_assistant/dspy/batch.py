@@ -0,0 +1,172 @@
+"""Offline video-idea generation through the OpenAI Batch API.
+
+Batch jobs are billed at a discount and complete within 24h, which suits bulk
+evaluation runs where nobody is waiting on an individual answer.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+import dspy
+
+from influencer_assistant.profile import InfluencerProfile
+
+from .context import render_profile_context
+from .video_ideas import (
+    VideoIdea,
+    VideoIdeaGenerator,
+    _fallback_ideas,
+    _sends_prompt_cache_key,
+)
+
+_ENDPOINT = "/v1/chat/completions"
+# Batch states that can still reach "completed"; anything else is terminal.
+_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+
+
+class BatchIdeaGenerator:
+    """Submit `VideoIdeaGenerator` prompts as one OpenAI batch and parse the results.
+
+    Prompts are formatted with the generator's signature and demos through the
+    DSPy chat adapter, so a tuned generator behaves the same in batch mode.
+    """
+
+    def __init__(
+        self,
+        generator: VideoIdeaGenerator,
+        *,
+        model: Optional[str] = None,
+        client: Any | None = None,
+    ) -> None:
+        self.generator = generator
+        self._model = model
+        self._client = client
+        self._adapter = dspy.ChatAdapter()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI()
+        return self._client
+
+    @property
+    def model(self) -> str:
+        model = self._model or getattr(dspy.settings.lm, "model", None) or "openai/gpt-4o-mini"
+        return model.removeprefix("openai/")
+
+    def build_requests(
+        self, profiles: Sequence[InfluencerProfile], requests: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """Return one Batch API request line per `(profile, request)` pair."""
+
+        if len(profiles) != len(requests):
+            raise ValueError("profiles and requests must have the same length")
+
+        predict = self.generator.predict
+        lines = []
+        for index, (profile, request) in enumerate(zip(profiles, requests)):
+            messages = self._adapter.format(
+                predict.signature,
+                demos=predict.demos,
+                inputs={
+                    "profile_context": render_profile_context(profile),
+                    "request": self.generator._request_text(request, None),
+                },
+            )
+            body: Dict[str, Any] = {"model": self.model, "messages": messages}
+            if _sends_prompt_cache_key():
+                body["prompt_cache_key"] = profile.creator_id
+            lines.append(
+                {"custom_id": str(index), "method": "POST", "url": _ENDPOINT, "body": body}
+            )
+        return lines
+
+    def submit(self, profiles: Sequence[InfluencerProfile], requests: Sequence[str]) -> str:
+        """Upload the batch input file, start the job and return its batch id."""
+
+        payload = "\n".join(json.dumps(line) for line in self.build_requests(profiles, requests))
+        upload = self.client.files.create(
+            file=("video_ideas_batch.jsonl", io.BytesIO(payload.encode("utf-8"))),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint=_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def fetch(
+        self,
+        batch_id: str,
+        profiles: Sequence[InfluencerProfile],
+        requests: Sequence[str],
+    ) -> Optional[List[List[VideoIdea]]]:
+        """Return ideas per submitted pair once the batch completed, else `None`.
+
+        `profiles` and `requests` must be the sequences passed to `submit`. Pairs
+        whose request failed or could not be parsed fall back to deterministic ideas.
+        Raises `RuntimeError` if the batch ended without completing (failed,
+        expired or cancelled), so pollers do not wait on it forever.
+        """
+
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in _PENDING_STATUSES:
+            return None
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"Batch {batch_id} ended with status {batch.status!r}{_batch_errors(batch)}"
+            )
+
+        completions: Dict[str, str] = {}
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                choices = (response.get("body") or {}).get("choices") or []
+                if choices:
+                    completions[record["custom_id"]] = choices[0]["message"]["content"] or ""
+
+        results: List[List[VideoIdea]] = []
+        for index, (profile, request) in enumerate(zip(profiles, requests)):
+            ideas = self._parse_completion(profile, completions.get(str(index), ""))
+            if not ideas:
+                ideas = _fallback_ideas(
+                    profile=profile,
+                    request=request,
+                    max_ideas=self.generator._target_count,
+                )
+            results.append(ideas)
+        return results
+
+    def _parse_completion(self, profile: InfluencerProfile, completion: str) -> List[VideoIdea]:
+        if not completion:
+            return []
+        try:
+            fields = self._adapter.parse(self.generator.predict.signature, completion)
+        except Exception:  # malformed completions fall back, as in forward()
+            return []
+        return self.generator._ideas_from_prediction(profile, dspy.Prediction(**fields))
+
+
+def _batch_errors(batch: Any) -> str:
+    """Format the batch's reported errors as a message suffix, if there are any."""
+
+    errors = getattr(getattr(batch, "errors", None), "data", None) or []
+    details = "; ".join(
+        f"{getattr(error, 'code', None) or 'error'}: {getattr(error, 'message', '')}"
+        for error in errors
+    )
+    return f": {details}" if details else ""
+
+
+__all__ = ["BatchIdeaGenerator"]
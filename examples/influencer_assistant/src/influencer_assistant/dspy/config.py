@@ -1,12 +1,44 @@
 """Config helpers - delegates to observable_agent_starter."""
 
-from observable_agent_starter import configure_lm_from_env
+from __future__ import annotations
+
+import functools
+import os
+from typing import Optional, Tuple
+
+from observable_agent_starter import configure_lm_from_env as _base_configure_lm_from_env
 import dspy
 
+_LM_ENV_VARS = ("OPENAI_API_KEY", "OPENAI_MODEL", "OPENAI_BASE_URL", "OPENAI_TEMPERATURE")
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_for_env(env: Tuple[Optional[str], ...]) -> bool:
+    return _base_configure_lm_from_env()
+
+
+def configure_lm_from_env() -> bool:
+    """Configure DSPy from `OPENAI_*` env vars, memoized per environment snapshot.
+
+    Repeat calls with unchanged env vars skip the dotenv scan and LM setup. If the
+    LM has since been cleared from `dspy.settings`, configuration runs again. Only
+    successes are memoized: an LM configured through another path after a failed
+    call is picked up, as in the core helper.
+    """
+
+    configured = _configure_for_env(tuple(os.environ.get(key) for key in _LM_ENV_VARS))
+    if configured and dspy.settings.lm is None:
+        _configure_for_env.cache_clear()
+        configured = _configure_for_env(tuple(os.environ.get(key) for key in _LM_ENV_VARS))
+    if not configured:
+        _configure_for_env.cache_clear()
+    return configured
+
 
 def reset_lm() -> None:
     """Reset DSPy LM configuration."""
     dspy.settings.configure(lm=None)
+    _configure_for_env.cache_clear()
 
 
 __all__ = ["configure_lm_from_env", "reset_lm"]
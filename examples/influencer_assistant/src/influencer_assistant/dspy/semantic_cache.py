@@ -0,0 +1,75 @@
+"""Embedding-backed cache that reuses ideas across paraphrased requests."""
+
+from __future__ import annotations
+
+import math
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+Vector = Tuple[float, ...]
+
+
+class SemanticIdeaCache:
+    """Reuse generated ideas when a new request is close enough to a cached one.
+
+    `embedder` follows the `dspy.Embedder` calling convention: it takes a list of
+    strings and returns one vector per string, so both
+    `dspy.Embedder("openai/text-embedding-3-small")` and a local
+    sentence-transformers `encode` function work. Entries are sharded by a
+    caller-provided scope (e.g. creator id) so each lookup only compares against
+    a handful of vectors.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[List[str]], Sequence[Sequence[float]]],
+        *,
+        threshold: float = 0.92,
+        max_entries_per_scope: int = 256,
+    ) -> None:
+        self._embedder = embedder
+        self.threshold = threshold
+        self._max_entries = max_entries_per_scope
+        self._shards: Dict[Hashable, "OrderedDict[Vector, Any]"] = {}
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> Vector:
+        """Return the unit-normalized embedding for `text`."""
+
+        vector = tuple(float(x) for x in self._embedder([text])[0])
+        norm = math.sqrt(sum(x * x for x in vector))
+        return tuple(x / norm for x in vector) if norm else vector
+
+    def lookup(self, scope: Hashable, query: Vector) -> Optional[Any]:
+        """Return the value stored for the most similar request above the threshold."""
+
+        with self._lock:
+            shard = self._shards.get(scope)
+            if not shard:
+                return None
+            best_key, best_score = None, self.threshold
+            for key in shard:
+                score = sum(map(operator.mul, key, query))
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                return None
+            shard.move_to_end(best_key)
+            return shard[best_key]
+
+    def store(self, scope: Hashable, query: Vector, value: Any) -> None:
+        with self._lock:
+            shard = self._shards.setdefault(scope, OrderedDict())
+            shard[query] = value
+            shard.move_to_end(query)
+            while len(shard) > self._max_entries:
+                shard.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shards.clear()
+
+
+__all__ = ["SemanticIdeaCache"]
@@ -5,8 +5,17 @@ Demonstrates composition pattern with ObservabilityProvider from observable_agen
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import List, Sequence
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from itertools import cycle, islice
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
 
 import dspy
 
@@ -15,9 +24,36 @@ from influencer_assistant.profile import InfluencerProfile
 
 from .context import render_profile_context
 from .config import configure_lm_from_env
-
-
-@dataclass
+from .semantic_cache import SemanticIdeaCache
+
+# Process-wide LRU of LM predictions, keyed by prompt + signature + model, with a
+# TTL so long-running dashboards eventually pick up fresh generations.
+_PREDICTION_CACHE_MAXSIZE = 1024
+_PREDICTION_CACHE_TTL_SECONDS = 15 * 60
+_PREDICTION_CACHE: "OrderedDict[str, Tuple[float, dspy.Prediction]]" = OrderedDict()
+_PREDICTION_CACHE_LOCK = threading.Lock()
+
+# One idea per non-blank line: optional "1." / "2)" numbering, then either
+# "<title - summary>|<pillar>" split on the last "|", or a bare line without a pillar.
+_IDEA_LINE_RE = re.compile(
+    r"^[^\S\n]*(?=\S)(?:[0-9][0-9). ]*)?"
+    r"(?:(?P<left>[^\n]*)\|(?P<pillar>[^|\n]*)|(?P<bare>[^\n]*))$",
+    re.MULTILINE,
+)
+
+# Static instructions go ahead of the per-call request so the prompt prefix stays
+# identical across calls for the same creator (OpenAI prompt caching is prefix-based).
+_LIST_INSTRUCTIONS = (
+    "Return them as a numbered list where each item includes a title, target pillar, "
+    "and a short summary separated by ' - '."
+)
+_VARIATION_HINT = (
+    " Variation token: {}. Use it to provide fresh, non-repeated ideas and do not mention "
+    "the token in the response."
+)
+
+
+@dataclass(frozen=True, slots=True)
 class VideoIdea:
     """Structured representation of a suggested video idea."""
 
@@ -32,7 +68,7 @@ class VideoIdeaSignature(dspy.Signature):
     profile_context = dspy.InputField(desc="Key details about the creator business")
     request = dspy.InputField(desc="Manager request or constraints")
     response = dspy.OutputField(
-        desc=("Return exactly 3 numbered lines, each formatted as: " "'Title - Summary | Pillar'.")
+        desc=("Return exactly 3 numbered lines, each formatted as: 'Title - Summary | Pillar'.")
     )
 
 
@@ -40,13 +76,38 @@ class VideoIdeaGenerator(dspy.Module):
     """Generate video ideas grounded in a `InfluencerProfile`.
 
     Uses composition pattern with ObservabilityProvider for tracing.
+
+    With ``structured=True`` the LM fills `VideoIdeasStructuredSignature` fields
+    directly instead of returning a numbered list that has to be parsed; that
+    signature yields at most 3 ideas regardless of ``target_count``.
+
+    Pass a `SemanticIdeaCache` to reuse ideas for paraphrased requests from the
+    same creator; requests carrying a ``variation_token`` always bypass it.
     """
 
-    def __init__(self, observability: ObservabilityProvider, *, target_count: int = 4) -> None:
+    def __init__(
+        self,
+        observability: ObservabilityProvider,
+        *,
+        target_count: int = 4,
+        enable_cache: bool = True,
+        structured: bool = False,
+        semantic_cache: SemanticIdeaCache | None = None,
+    ) -> None:
         super().__init__()
         self.observability = observability
-        self.predict = dspy.Predict(VideoIdeaSignature)
+        self.predict = dspy.Predict(
+            VideoIdeasStructuredSignature if structured else VideoIdeaSignature
+        )
         self._target_count = target_count
+        self._enable_cache = enable_cache
+        self._structured = structured
+        self._semantic_cache = semantic_cache
+        self._request_prefix = (
+            "Provide concise video ideas.\nRequest: "
+            if structured
+            else f"Provide {target_count} concise video ideas. {_LIST_INSTRUCTIONS}\nRequest: "
+        )
 
     def forward(
         self,
@@ -55,14 +116,11 @@ class VideoIdeaGenerator(dspy.Module):
         request: str = "Generate topical video ideas",
         variation_token: str | None = None,
     ) -> Sequence[VideoIdea]:
-        configure_lm_from_env()
+        # An already-configured LM always wins in configure_lm_from_env, so only
+        # fall through to the env/dotenv lookup while no LM is set.
+        if dspy.settings.lm is None:
+            configure_lm_from_env()
 
-        profile_context = render_profile_context(profile)
-        variation_hint = (
-            f" Variation token: {variation_token}. Use it to provide fresh, non-repeated ideas and do not mention the token in the response."
-            if variation_token
-            else ""
-        )
         fallback_reason = None
 
         if dspy.settings.lm is None:
@@ -73,27 +131,27 @@ class VideoIdeaGenerator(dspy.Module):
             )
             fallback_reason = "no_lm"
         else:
-            prediction = self.predict(
-                profile_context=profile_context,
-                request=(
-                    f"Provide {self._target_count} concise video ideas that align with the request: {request}. "
-                    "Return them as a numbered list where each item includes a title, target pillar, and a short summary separated by ' - '."
-                    + variation_hint
-                ),
-            )
-            ideas = _parse_ideas(
-                prediction.response,
-                default_pillars=profile.content_pillars,
-                max_ideas=self._target_count,
-            )
-
-            if not ideas:
-                ideas = _fallback_ideas(
-                    profile=profile,
-                    request=request,
-                    max_ideas=self._target_count,
-                )
-                fallback_reason = "empty_response"
+            semantic_query = None
+            semantic_scope = (profile.creator_id, self._target_count, self._structured)
+            cached_ideas = None
+            if self._semantic_cache is not None and not variation_token:
+                semantic_query = self._semantic_cache.embed(request)
+                cached_ideas = self._semantic_cache.lookup(semantic_scope, semantic_query)
+
+            if cached_ideas is not None:
+                # VideoIdea is frozen, so cached instances can be shared safely.
+                ideas = list(cached_ideas)
+            else:
+                ideas = self._predict_ideas(profile, request, variation_token)
+                if not ideas:
+                    ideas = _fallback_ideas(
+                        profile=profile,
+                        request=request,
+                        max_ideas=self._target_count,
+                    )
+                    fallback_reason = "empty_response"
+                elif semantic_query is not None:
+                    self._semantic_cache.store(semantic_scope, semantic_query, tuple(ideas))
 
         # Log via ObservabilityProvider
         self.observability.log_generation(
@@ -101,7 +159,11 @@ class VideoIdeaGenerator(dspy.Module):
             output_data={
                 "creator_id": profile.creator_id,
                 "handle": profile.handle,
-                "ideas": [asdict(idea) for idea in ideas],
+                # VideoIdea is flat, so build the dicts directly instead of asdict()'s deep copy.
+                "ideas": [
+                    {"title": idea.title, "summary": idea.summary, "pillar": idea.pillar}
+                    for idea in ideas
+                ],
             },
             variation_token=variation_token,
             fallback_reason=fallback_reason,
@@ -109,9 +171,147 @@ class VideoIdeaGenerator(dspy.Module):
 
         return ideas
 
+    def _predict_ideas(
+        self, profile: InfluencerProfile, request: str, variation_token: str | None
+    ) -> List[VideoIdea]:
+        prediction = self._predict_cached(
+            render_profile_context(profile),
+            self._request_text(request, variation_token),
+            prompt_cache_key=profile.creator_id,
+        )
+        return self._ideas_from_prediction(profile, prediction)
+
+    def _request_text(self, request: str, variation_token: str | None) -> str:
+        return "".join(
+            (
+                self._request_prefix,
+                request,
+                _VARIATION_HINT.format(variation_token) if variation_token else "",
+            )
+        )
 
-def _parse_ideas(
-    text: str,
+    def _ideas_from_prediction(
+        self, profile: InfluencerProfile, prediction: dspy.Prediction
+    ) -> List[VideoIdea]:
+        if self._structured:
+            return _structured_ideas(
+                prediction,
+                default_pillars=profile.content_pillars,
+                max_ideas=self._target_count,
+            )
+        return _parse_ideas(
+            prediction.get("response") or "",
+            default_pillars=profile.content_pillars,
+            max_ideas=self._target_count,
+        )
+
+    async def aforward(
+        self,
+        profile: InfluencerProfile,
+        *,
+        request: str = "Generate topical video ideas",
+        variation_token: str | None = None,
+    ) -> Sequence[VideoIdea]:
+        """Async `forward`: runs the blocking LM call in a worker thread."""
+
+        return await dspy.asyncify(self)(profile, request=request, variation_token=variation_token)
+
+    async def generate_many(
+        self,
+        profiles: Iterable[InfluencerProfile],
+        *,
+        request: str = "Generate topical video ideas",
+        concurrency: int = 8,
+    ) -> List[Sequence[VideoIdea]]:
+        """Generate ideas for several profiles concurrently, preserving input order."""
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(profile: InfluencerProfile) -> Sequence[VideoIdea]:
+            async with semaphore:
+                return await self.aforward(profile, request=request)
+
+        return list(await asyncio.gather(*(_one(profile) for profile in profiles)))
+
+    def _predict_cached(
+        self,
+        profile_context: str,
+        request_text: str,
+        *,
+        prompt_cache_key: str | None = None,
+    ) -> dspy.Prediction:
+        """Return the LM prediction, reusing a cached answer for identical prompts."""
+
+        if not self._enable_cache:
+            return self._predict(profile_context, request_text, prompt_cache_key)
+
+        # Everything that shapes the prompt or the LM call goes into the key, so a
+        # recompiled generator (new demos/instructions) or a differently configured
+        # LM sharing the same model string never sees stale answers.
+        lm = dspy.settings.lm
+        signature = self.predict.signature
+        key = hashlib.sha256(
+            json.dumps(
+                {
+                    "ctx": profile_context,
+                    "req": request_text,
+                    "sig": signature.__name__,
+                    "instructions": signature.instructions,
+                    "demos": [_demo_dict(demo) for demo in self.predict.demos],
+                    "model": getattr(lm, "model", None),
+                    "lm_kwargs": getattr(lm, "kwargs", None),
+                },
+                sort_keys=True,
+                default=repr,
+            ).encode("utf-8")
+        ).hexdigest()
+
+        now = time.monotonic()
+        with _PREDICTION_CACHE_LOCK:
+            hit = _PREDICTION_CACHE.get(key)
+            if hit is not None and hit[0] > now:
+                _PREDICTION_CACHE.move_to_end(key)
+                return hit[1]
+
+        prediction = self._predict(profile_context, request_text, prompt_cache_key)
+        if any(prediction.values()):
+            with _PREDICTION_CACHE_LOCK:
+                _PREDICTION_CACHE[key] = (now + _PREDICTION_CACHE_TTL_SECONDS, prediction)
+                _PREDICTION_CACHE.move_to_end(key)
+                while len(_PREDICTION_CACHE) > _PREDICTION_CACHE_MAXSIZE:
+                    _PREDICTION_CACHE.popitem(last=False)
+        return prediction
+
+    def _predict(
+        self, profile_context: str, request_text: str, prompt_cache_key: str | None
+    ) -> dspy.Prediction:
+        config = {}
+        model = getattr(dspy.settings.lm, "model", None) or ""
+        if prompt_cache_key and model.startswith("openai/") and _sends_prompt_cache_key():
+            # Routes same-creator requests to the same OpenAI prompt-cache shard.
+            config["prompt_cache_key"] = prompt_cache_key
+        return self.predict(profile_context=profile_context, request=request_text, config=config)
+
+
+def _sends_prompt_cache_key() -> bool:
+    """Whether requests may carry OpenAI's `prompt_cache_key` field.
+
+    OpenAI-compatible servers configured through OPENAI_BASE_URL may reject
+    fields they do not know, so the key is only sent to the default endpoint.
+    """
+
+    return not os.getenv("OPENAI_BASE_URL")
+
+
+def _demo_dict(demo: object) -> object:
+    """Plain-dict view of a demo (`dspy.Example` or mapping) for cache keys."""
+
+    to_dict = getattr(demo, "toDict", None)
+    return to_dict() if callable(to_dict) else demo
+
+
+def _structured_ideas(
+    prediction: dspy.Prediction,
     *,
     default_pillars: Sequence[str],
     max_ideas: int,
@@ -119,28 +319,55 @@ def _parse_ideas(
     ideas: List[VideoIdea] = []
     current_pillar_index = 0
 
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
+    for i in (1, 2, 3):
+        title = (getattr(prediction, f"idea{i}_title", None) or "").strip()
+        summary = (getattr(prediction, f"idea{i}_summary", None) or "").strip()
+        pillar = (getattr(prediction, f"idea{i}_pillar", None) or "").strip() or None
+        if not (title or summary):
             continue
-        # Remove numbering like "1." or "1)"
-        if line and line[0].isdigit():
-            line = line.lstrip("0123456789). ")
 
-        pillar = None
-        summary = ""
-        title = line
+        if not pillar and default_pillars:
+            pillar = default_pillars[current_pillar_index % len(default_pillars)]
+            current_pillar_index += 1
+
+        ideas.append(
+            VideoIdea(
+                title=title or "Idea",
+                summary=summary or "Fill in details",
+                pillar=pillar,
+            )
+        )
+
+    return ideas[: max(1, max_ideas)]
+
 
+def _parse_ideas(
+    text: str,
+    *,
+    default_pillars: Sequence[str],
+    max_ideas: int,
+) -> List[VideoIdea]:
+    if not text:
+        return []
+
+    ideas: List[VideoIdea] = []
+    current_pillar_index = 0
+
+    # `_IDEA_LINE_RE` only breaks on "\n"; fold "\r\n", "\x0b", "\u2028", etc.
+    # into it so lines split exactly as `str.splitlines()` would.
+    text = "\n".join(text.splitlines())
+    for match in _IDEA_LINE_RE.finditer(text):
         # Preferred format: Title - Summary | Pillar
-        if "|" in line:
-            left, pillar = [part.strip() for part in line.rsplit("|", maxsplit=1)]
+        left, pillar, bare = match.group("left", "pillar", "bare")
+        if pillar is None:
+            left = bare.rstrip()
         else:
-            left = line
+            left = left.strip()
+            pillar = pillar.strip()
 
-        if " - " in left:
-            title, summary = [part.strip() for part in left.split(" - ", maxsplit=1)]
-        else:
-            title = left.strip()
+        title, _, summary = left.partition(" - ")
+        title = title.strip()
+        summary = summary.strip()
 
         if not pillar and default_pillars:
             pillar = default_pillars[current_pillar_index % len(default_pillars)]
@@ -165,28 +392,22 @@ def _fallback_ideas(
 ) -> List[VideoIdea]:
     """Generate deterministic fallback ideas when no LM output is available."""
 
-    ideas: List[VideoIdea] = []
     pillars = profile.content_pillars or ["Strategy"]
-    base_titles = [
+    base_titles = (
         "Playbook Spotlight",
         "Behind-the-Scenes Ops",
         "Automation Boost",
         "Community Wins",
-    ]
+    )
 
-    for idx in range(max_ideas):
-        pillar = pillars[idx % len(pillars)]
-        title = f"{pillar} {base_titles[idx % len(base_titles)]}"
-        summary = f"Actionable idea inspired by the '{pillar}' pillar to address: {request}."
-        ideas.append(
-            VideoIdea(
-                title=title,
-                summary=summary,
-                pillar=pillar,
-            )
+    return [
+        VideoIdea(
+            title=f"{pillar} {base_title}",
+            summary=f"Actionable idea inspired by the '{pillar}' pillar to address: {request}.",
+            pillar=pillar,
         )
-
-    return ideas
+        for pillar, base_title in islice(zip(cycle(pillars), cycle(base_titles)), max(0, max_ideas))
+    ]
 
 
 class VideoIdeasStructuredSignature(dspy.Signature):
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Annotated, Any, Dict, Iterable, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
+
+
+def _list_field(data: Dict[str, Any], key: str) -> List[Any]:
+    """Return a fresh list for `data[key]`, treating missing or empty values as `[]`."""
+
+    value = data.get(key)
+    return list(value) if value else []
 
 
 class InfluencerProfile(BaseModel):
@@ -26,7 +33,9 @@ class InfluencerProfile(BaseModel):
     community: Dict[str, Any] = Field(default_factory=dict)
     experiments: List[Dict[str, Any]] = Field(default_factory=list)
     assets: List[Dict[str, Any]] = Field(default_factory=list)
-    raw: Dict[str, Any] = Field(default_factory=dict)
+    # The raw payload is kept as-is for reference; validating it would copy the
+    # whole input snapshot on every build.
+    raw: Annotated[Dict[str, Any], SkipValidation] = Field(default_factory=dict)
 
 
 class InfluencerProfileBuilder:
@@ -35,19 +44,27 @@ class InfluencerProfileBuilder:
     def __init__(self, llm_runner: Any | None = None) -> None:
         self._llm_runner = llm_runner
 
-    def build(self, inputs: Dict[str, Any]) -> InfluencerProfile:
-        identity = inputs.get("creator_identity", {}) or {}
-        analytics = inputs.get("analytics", {}) or {}
-        content = inputs.get("content_library", {}) or {}
-        call_notes = inputs.get("call_notes", []) or []
-        research = inputs.get("market_research", {}) or {}
-        operations = inputs.get("operations", {}) or {}
-        community = inputs.get("community", {}) or {}
-        experiments = list(inputs.get("experiments", []) or [])
-        asset_library = list(inputs.get("asset_library", []) or [])
-        workflows = list(inputs.get("workflows", []) or [])
-
-        profile = InfluencerProfile(
+    def build(self, inputs: Dict[str, Any], *, validate: bool = True) -> InfluencerProfile:
+        """Normalize `inputs` into a validated `InfluencerProfile`.
+
+        Pass ``validate=False`` only for trusted snapshots, such as the bundled
+        fixtures, to skip Pydantic validation via `model_construct`; invalid values
+        (e.g. a non-string ``creator_id``) are then accepted silently.
+        """
+
+        identity = inputs.get("creator_identity") or {}
+        analytics = inputs.get("analytics") or {}
+        content = inputs.get("content_library") or {}
+        call_notes = inputs.get("call_notes") or []
+        research = inputs.get("market_research") or {}
+        operations = inputs.get("operations") or {}
+        community = inputs.get("community") or {}
+        experiments = _list_field(inputs, "experiments")
+        asset_library = _list_field(inputs, "asset_library")
+        workflows = _list_field(inputs, "workflows")
+
+        construct = InfluencerProfile if validate else InfluencerProfile.model_construct
+        profile = construct(
             creator_id=identity.get("creator_id", ""),
             handle=identity.get("handle", ""),
             name=identity.get("name", ""),
@@ -56,7 +73,7 @@ class InfluencerProfileBuilder:
             monetization=identity.get("monetization"),
             goals=self._build_goals(identity=identity, analytics=analytics),
             audience=self._build_audience(research.get("audience")),
-            content_pillars=list(content.get("pillars", []) or []),
+            content_pillars=_list_field(content, "pillars"),
             publishing_cadence=self._build_publishing_cadence(analytics.get("upload_frequency")),
             backlog=self._build_backlog(
                 call_notes=call_notes,
@@ -101,8 +118,8 @@ class InfluencerProfileBuilder:
 
         audience = {
             "persona": raw_audience.get("persona", ""),
-            "pain_points": list(raw_audience.get("pain_points", []) or []),
-            "desired_outcomes": list(raw_audience.get("desired_outcomes", []) or []),
+            "pain_points": _list_field(raw_audience, "pain_points"),
+            "desired_outcomes": _list_field(raw_audience, "desired_outcomes"),
         }
         return audience
 
@@ -114,44 +131,38 @@ class InfluencerProfileBuilder:
         upcoming_ideas: Optional[Iterable[Dict[str, Any]]],
         workflow_tasks: Iterable[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        backlog: List[Dict[str, Any]] = []
-
-        for note in call_notes:
-            actions = note.get("action_items") or []
-            if not actions:
-                continue
-            backlog.append(
-                {
-                    "type": "call_followup",
-                    "source_date": note.get("date"),
-                    "summary": note.get("summary"),
-                    "actions": list(actions),
-                }
-            )
-
-        for idea in upcoming_ideas or []:
-            backlog.append(
-                {
-                    "type": "content_idea",
-                    "title": idea.get("title", ""),
-                    "status": idea.get("status", ""),
-                    "notes": idea.get("notes", ""),
-                }
-            )
-
-        for task in workflow_tasks or []:
-            backlog.append(
-                {
-                    "type": "workflow_task",
-                    "title": task.get("title", ""),
-                    "status": task.get("status", ""),
-                    "due_date": task.get("due_date"),
-                    "owner": task.get("owner"),
-                    "notes": task.get("notes", ""),
-                }
-            )
-
-        return backlog
+        followups = [
+            {
+                "type": "call_followup",
+                "source_date": note.get("date"),
+                "summary": note.get("summary"),
+                "actions": list(actions),
+            }
+            for note in call_notes
+            if (actions := note.get("action_items"))
+        ]
+        ideas = [
+            {
+                "type": "content_idea",
+                "title": idea.get("title", ""),
+                "status": idea.get("status", ""),
+                "notes": idea.get("notes", ""),
+            }
+            for idea in upcoming_ideas or []
+        ]
+        tasks = [
+            {
+                "type": "workflow_task",
+                "title": task.get("title", ""),
+                "status": task.get("status", ""),
+                "due_date": task.get("due_date"),
+                "owner": task.get("owner"),
+                "notes": task.get("notes", ""),
+            }
+            for task in workflow_tasks or []
+        ]
+
+        return [*followups, *ideas, *tasks]
 
     @staticmethod
     def _build_publishing_cadence(frequency: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -185,11 +196,11 @@ class InfluencerProfileBuilder:
             "owner": operations.get("owner"),
             "talent_manager": operations.get("talent_manager"),
             "strategist": operations.get("strategist"),
-            "editor_pod": list(operations.get("editor_pod", []) or []),
-            "additional_team": list(operations.get("additional_team", []) or []),
+            "editor_pod": _list_field(operations, "editor_pod"),
+            "additional_team": _list_field(operations, "additional_team"),
             "timezone": operations.get("timezone"),
             "automation_notes": operations.get("automation_notes"),
-            "integrations": list(operations.get("integrations", []) or []),
+            "integrations": _list_field(operations, "integrations"),
         }
 
     @staticmethod
@@ -201,37 +212,33 @@ class InfluencerProfileBuilder:
             "sentiment": community.get("sentiment"),
             "response_sla_hours": community.get("response_sla_hours"),
             "pending_replies": community.get("pending_replies", 0),
-            "highlighted_threads": list(community.get("highlighted_threads", []) or []),
-            "macros": list(community.get("macros", []) or []),
+            "highlighted_threads": _list_field(community, "highlighted_threads"),
+            "macros": _list_field(community, "macros"),
             "notes": community.get("notes"),
         }
 
     @staticmethod
     def _build_experiments(experiments: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        built: List[Dict[str, Any]] = []
-        for experiment in experiments or []:
-            built.append(
-                {
-                    "name": experiment.get("name", ""),
-                    "hypothesis": experiment.get("hypothesis"),
-                    "metric": experiment.get("metric"),
-                    "status": experiment.get("status", ""),
-                    "latest_result": experiment.get("latest_result"),
-                    "next_check_in": experiment.get("next_check_in"),
-                }
-            )
-        return built
+        return [
+            {
+                "name": experiment.get("name", ""),
+                "hypothesis": experiment.get("hypothesis"),
+                "metric": experiment.get("metric"),
+                "status": experiment.get("status", ""),
+                "latest_result": experiment.get("latest_result"),
+                "next_check_in": experiment.get("next_check_in"),
+            }
+            for experiment in experiments or []
+        ]
 
     @staticmethod
     def _build_assets(assets: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        built: List[Dict[str, Any]] = []
-        for asset in assets or []:
-            built.append(
-                {
-                    "asset_type": asset.get("asset_type", ""),
-                    "title": asset.get("title", ""),
-                    "url": asset.get("url", ""),
-                    "notes": asset.get("notes"),
-                }
-            )
-        return built
+        return [
+            {
+                "asset_type": asset.get("asset_type", ""),
+                "title": asset.get("title", ""),
+                "url": asset.get("url", ""),
+                "notes": asset.get("notes"),
+            }
+            for asset in assets or []
+        ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,19 +13,33 @@ import dspy
 from influencer_assistant.dspy.context import render_profile_context
 from influencer_assistant.profile import InfluencerProfile, InfluencerProfileBuilder
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 FIXTURES_DIR = Path(__file__).resolve().parents[3] / "tests" / "fixtures"
 
 
-PILLARS = {
-    "AI tooling deep dives",
-    "Agency growth playbooks",
-    "Behind-the-scenes ops",
-    "Enterprise growth playbooks",
-    "Live show replays",
-    "Tooling breakdowns",
-    "Automation walk-throughs",
-    "Template showcases",
-    "Creator case studies",
+PILLARS = frozenset(
+    {
+        "AI tooling deep dives",
+        "Agency growth playbooks",
+        "Behind-the-scenes ops",
+        "Enterprise growth playbooks",
+        "Live show replays",
+        "Tooling breakdowns",
+        "Automation walk-throughs",
+        "Template showcases",
+        "Creator case studies",
+    }
+)
+
+# Known spelling variants mapped to their canonical pillar label.
+_PILLAR_VARIANTS = {
+    "Automation walkthroughs": "Automation walk-throughs",
+    "Automation walk throughs": "Automation walk-throughs",
+    "Behind the scenes ops": "Behind-the-scenes ops",
 }
 
 
@@ -44,14 +59,7 @@ def _std_summary(s: str) -> str:
 
 def _std_pillar(p: str) -> str:
     p = p.strip()
-    # Normalize known variants
-    variants = {
-        "Automation walkthroughs": "Automation walk-throughs",
-        "Automation walk throughs": "Automation walk-throughs",
-        "Behind the scenes ops": "Behind-the-scenes ops",
-    }
-    p = variants.get(p, p)
-    return p
+    return _PILLAR_VARIANTS.get(p, p)
 
 
 def _validate_and_standardize(ideas: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -70,7 +78,7 @@ def _validate_and_standardize(ideas: List[Dict[str, str]]) -> List[Dict[str, str
     return out
 
 
-@dataclass
+@dataclass(slots=True)
 class IdeaTrainingExample:
     """Container for a single idea-generation training record."""
 
@@ -223,10 +231,13 @@ _RAW_EXAMPLES: List[IdeaTrainingExample] = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
 def _load_profile(fixture_name: str) -> InfluencerProfile:
     builder = InfluencerProfileBuilder()
-    payload = json.loads((FIXTURES_DIR / fixture_name).read_text())
-    return builder.build(payload)
+    raw = (FIXTURES_DIR / fixture_name).read_bytes()
+    payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    # Bundled fixtures are trusted, so skip re-validating them.
+    return builder.build(payload, validate=False)
 
 
 def build_training_dataset() -> List[dspy.Example]:
@@ -234,9 +245,15 @@ def build_training_dataset() -> List[dspy.Example]:
 
     examples: List[dspy.Example] = []
 
+    # Several records share a fixture: load, build and render each fixture once.
+    # Loading stays serial: fixtures are small local files, so the cost is JSON
+    # parsing and model building under the GIL and a thread pool only adds overhead.
+    fixture_names = {record.fixture for record in _RAW_EXAMPLES}
+    profiles = {name: _load_profile(name) for name in fixture_names}
+    contexts = {name: render_profile_context(profiles[name]) for name in fixture_names}
+
     for record in _RAW_EXAMPLES:
-        profile = _load_profile(record.fixture)
-        context = render_profile_context(profile)
+        context = contexts[record.fixture]
         ideas = _validate_and_standardize(record.expected_ideas)
         # Map to structured output fields expected by the structured signature
         fields = {
@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
 EXAMPLE_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = EXAMPLE_ROOT / "src"
@@ -13,3 +23,51 @@ if str(SRC_DIR) not in sys.path:
 TRAINING_DIR = EXAMPLE_ROOT / "training"
 if str(TRAINING_DIR) not in sys.path:
     sys.path.insert(0, str(TRAINING_DIR))
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_fixture(name: str) -> Dict[str, Any]:
+    raw = (FIXTURES_DIR / name).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@pytest.fixture(scope="session")
+def load_fixture() -> Callable[[str], Dict[str, Any]]:
+    """Parse a fixture snapshot by file name, once per test session.
+
+    Payloads are shared between tests, so treat them as read-only.
+    """
+
+    return _read_fixture
+
+
+@pytest.fixture(scope="session")
+def builder() -> Any:
+    """Shared `InfluencerProfileBuilder`; it holds no per-build state."""
+
+    from influencer_assistant.profile import InfluencerProfileBuilder
+
+    return InfluencerProfileBuilder(llm_runner=None)
+
+
+@pytest.fixture(scope="session")
+def profile_for(load_fixture, builder) -> Callable[[str], Any]:
+    """Build the `InfluencerProfile` for a fixture snapshot, once per test session."""
+
+    @functools.lru_cache(maxsize=None)
+    def _profile_for(name: str) -> Any:
+        # Bundled fixtures are trusted, so skip re-validating them.
+        return builder.build(load_fixture(name), validate=False)
+
+    return _profile_for
+
+
+@pytest.fixture(scope="session")
+def training_examples() -> List[Any]:
+    """`build_training_dataset()` result, built once and shared across modules."""
+
+    from influencer_assistant.training.dataset import build_training_dataset
+
+    return build_training_dataset()
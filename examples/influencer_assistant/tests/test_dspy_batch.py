@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("dspy")
+
+from influencer_assistant.dspy import BatchIdeaGenerator, VideoIdeaGenerator  # noqa: E402
+from influencer_assistant.profile import InfluencerProfile  # noqa: E402
+from observable_agent_starter import ObservabilityProvider  # noqa: E402
+
+FIXTURE_NAME = "creator_snapshot.json"
+
+
+@pytest.fixture(scope="module")
+def profile(profile_for) -> InfluencerProfile:
+    return profile_for(FIXTURE_NAME)
+
+
+class FakeBatchClient:
+    """Minimal stand-in for the OpenAI files/batches endpoints."""
+
+    def __init__(self, output_lines, *, status="completed", errors=None):
+        self.uploaded = b""
+        self._status = status
+        self._errors = errors
+        self._output = "\n".join(json.dumps(line) for line in output_lines)
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+
+    def _create_file(self, *, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = file[1].getvalue()
+        return SimpleNamespace(id="file-in")
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self._output)
+
+    def _create_batch(self, *, input_file_id, endpoint, completion_window):
+        assert input_file_id == "file-in"
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id):
+        return SimpleNamespace(
+            status=self._status,
+            output_file_id="file-out",
+            errors=SimpleNamespace(data=self._errors) if self._errors else None,
+        )
+
+
+def test_batch_generator_round_trip(profile: InfluencerProfile) -> None:
+    completion = (
+        "[[ ## response ## ]]\n"
+        "1. Automating Onboarding Results - Highlight our AI SOPs | AI tooling deep dives\n\n"
+        "[[ ## completed ## ]]"
+    )
+    client = FakeBatchClient(
+        [
+            {
+                "custom_id": "0",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": completion}}]},
+                },
+            },
+            {"custom_id": "1", "response": {"status_code": 500, "body": {}}},
+        ]
+    )
+    generator = VideoIdeaGenerator(ObservabilityProvider("test-batch"), target_count=2)
+    batch = BatchIdeaGenerator(generator, model="openai/gpt-4o-mini", client=client)
+    requests = ["Focus on lead gen", "Fallback please"]
+
+    assert batch.submit([profile, profile], requests) == "batch-1"
+    uploaded = [json.loads(line) for line in client.uploaded.decode().splitlines()]
+    assert [line["custom_id"] for line in uploaded] == ["0", "1"]
+    assert uploaded[0]["body"]["model"] == "gpt-4o-mini"
+
+    first, second = batch.fetch("batch-1", [profile, profile], requests)
+    assert first[0].title == "Automating Onboarding Results"
+    assert first[0].pillar == "AI tooling deep dives"
+    assert len(second) == 2  # failed request falls back to deterministic ideas
+
+
+def test_batch_fetch_returns_none_while_in_progress(profile: InfluencerProfile) -> None:
+    generator = VideoIdeaGenerator(ObservabilityProvider("test-batch"), target_count=2)
+    batch = BatchIdeaGenerator(generator, client=FakeBatchClient([], status="in_progress"))
+
+    assert batch.fetch("batch-1", [profile], ["Anything"]) is None
+
+
+def test_batch_fetch_raises_for_failed_batch(profile: InfluencerProfile) -> None:
+    client = FakeBatchClient(
+        [],
+        status="failed",
+        errors=[SimpleNamespace(code="invalid_request", message="bad input file")],
+    )
+    generator = VideoIdeaGenerator(ObservabilityProvider("test-batch"), target_count=2)
+    batch = BatchIdeaGenerator(generator, client=client)
+
+    with pytest.raises(RuntimeError, match="'failed': invalid_request: bad input file"):
+        batch.fetch("batch-1", [profile], ["Anything"])
+
+
+def test_build_requests_sends_prompt_cache_key_only_to_default_endpoint(
+    monkeypatch, profile: InfluencerProfile
+) -> None:
+    generator = VideoIdeaGenerator(ObservabilityProvider("test-batch"), target_count=2)
+    batch = BatchIdeaGenerator(generator, model="openai/gpt-4o-mini", client=FakeBatchClient([]))
+
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    (line,) = batch.build_requests([profile], ["Anything"])
+    assert line["body"]["prompt_cache_key"] == profile.creator_id
+
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://localhost:8000/v1")
+    (line,) = batch.build_requests([profile], ["Anything"])
+    assert "prompt_cache_key" not in line["body"]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 
-import dspy
 import pytest
 
-from influencer_assistant.dspy.config import configure_lm_from_env, reset_lm
+dspy = pytest.importorskip("dspy")
+
+from influencer_assistant.dspy.config import configure_lm_from_env, reset_lm  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -44,3 +45,41 @@ def test_configure_lm_from_env_with_key(monkeypatch):
 
     # Ensure repeat calls are harmless
     assert configure_lm_from_env() is True
+
+
+def test_configure_lm_from_env_memoizes_per_env(monkeypatch):
+    import influencer_assistant.dspy.config as config_module
+
+    calls: list[int] = []
+
+    def _fake_configure() -> bool:
+        calls.append(1)
+        dspy.settings.configure(lm=dspy.utils.DummyLM([]))
+        return True
+
+    monkeypatch.setattr(config_module, "_base_configure_lm_from_env", _fake_configure)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    assert configure_lm_from_env() is True
+    assert configure_lm_from_env() is True
+    assert len(calls) == 1
+
+    # A changed env snapshot, or an LM cleared behind our back, reconfigures.
+    monkeypatch.setenv("OPENAI_MODEL", "openai/other-model")
+    assert configure_lm_from_env() is True
+    dspy.settings.configure(lm=None)
+    assert configure_lm_from_env() is True
+    assert len(calls) == 3
+
+
+def test_configure_lm_from_env_picks_up_lm_configured_after_failure(monkeypatch):
+    from observable_agent_starter import config
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(config, "_load_dotenv_into_env", lambda: None)
+    assert configure_lm_from_env() is False
+
+    # e.g. the dashboard fallback or an explicit dspy.configure call
+    dspy.settings.configure(lm=dspy.utils.DummyLM([]))
+
+    assert configure_lm_from_env() is True
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import asyncio
 
-import dspy
 import pytest
 
-from influencer_assistant.dspy import VideoIdeaGenerator, render_profile_context
-from influencer_assistant.profile import InfluencerProfile, InfluencerProfileBuilder
-from observable_agent_starter import ObservabilityProvider
+# Skip (rather than error) this module when DSPy is unavailable, so the builder
+# tests can still run on their own.
+dspy = pytest.importorskip("dspy")
 
-FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "creator_snapshot.json"
+import influencer_assistant.dspy.video_ideas as video_ideas_module  # noqa: E402
+from influencer_assistant.dspy import (  # noqa: E402
+    SemanticIdeaCache,
+    VideoIdeaGenerator,
+    render_profile_context,
+)
+from influencer_assistant.profile import InfluencerProfile  # noqa: E402
+from observable_agent_starter import ObservabilityProvider  # noqa: E402
+
+FIXTURE_NAME = "creator_snapshot.json"
+
+# Just enough of a profile for context rendering checks, without the JSON builder.
+MINIMAL_PROFILE = InfluencerProfile(
+    creator_id="creator-1",
+    handle="@creator",
+    name="Creator",
+    description="",
+    niche="Ops",
+    goals={"primary": "Grow"},
+    audience={},
+    content_pillars=["AI tooling deep dives"],
+    publishing_cadence={},
+    risks=["Publishing cadence is below plan"],
+)
 
 
 @pytest.fixture(scope="module")
-def profile() -> InfluencerProfile:
-    payload = json.loads(FIXTURE_PATH.read_text())
-    builder = InfluencerProfileBuilder()
-    profile = builder.build(payload)
-    return profile
+def profile(profile_for) -> InfluencerProfile:
+    return profile_for(FIXTURE_NAME)
 
 
 @pytest.fixture
@@ -29,36 +47,87 @@ def mock_observability(monkeypatch):
     return provider
 
 
-@pytest.fixture(autouse=True)
-def configure_dummy_lm():
-    dspy.settings.configure(
-        lm=dspy.utils.DummyLM(
-            [
-                {
-                    "response": (
-                        "1. Automating Onboarding Results - Highlight our AI SOPs | AI tooling deep dives\n"
-                        "2. Turning Views Into Leads - Showcase success stories | Agency growth playbooks"
-                    )
-                }
-            ]
-        )
+DUMMY_RESPONSE = {
+    "response": (
+        "1. Automating Onboarding Results - Highlight our AI SOPs | AI tooling deep dives\n"
+        "2. Turning Views Into Leads - Showcase success stories | Agency growth playbooks"
     )
-    yield
-    dspy.settings.configure(lm=None)
+}
+
+STRUCTURED_RESPONSE = {
+    "idea1_title": "Automating Onboarding Results",
+    "idea1_summary": "Highlight our AI SOPs",
+    "idea1_pillar": "AI tooling deep dives",
+    "idea2_title": "Turning Views Into Leads",
+    "idea2_summary": "Showcase success stories",
+    "idea2_pillar": "",
+    "idea3_title": "",
+    "idea3_summary": "",
+    "idea3_pillar": "",
+}
+
+
+def _no_lm_configured() -> bool:
+    return False
+
+
+@pytest.fixture
+def no_lm(monkeypatch):
+    """Run without an LM: unset it and stop `configure_lm_from_env` loading one."""
+    monkeypatch.setattr(video_ideas_module, "configure_lm_from_env", _no_lm_configured)
+    with dspy.context(lm=None):
+        yield
+
+
+def one_shot_lm() -> dspy.utils.DummyLM:
+    """A DummyLM that answers once; a second LM call would not parse the same."""
+    return dspy.utils.DummyLM([DUMMY_RESPONSE])
+
+
+# Installed once per module as a context override rather than by mutating the
+# global settings: the "" key matches every prompt, so the LM is never exhausted.
+# Tests needing a different LM nest their own `dspy.context(lm=...)`.
+@pytest.fixture(autouse=True, scope="module")
+def configure_dummy_lm():
+    with dspy.context(lm=dspy.utils.DummyLM({"": DUMMY_RESPONSE})):
+        yield
 
 
-def test_render_profile_context_contains_core_sections(profile: InfluencerProfile) -> None:
-    context = render_profile_context(profile)
+def test_render_profile_context_contains_core_sections() -> None:
+    context = render_profile_context(MINIMAL_PROFILE)
     assert "Creator Identity" in context
     assert "Content Pillars" in context
     assert "Risks" in context
 
 
+def test_render_profile_context_reflects_profile_edits(profile: InfluencerProfile) -> None:
+    copy = profile.model_copy(deep=True)
+    assert render_profile_context(copy) == render_profile_context(profile)
+
+    copy.content_pillars.append("Newly added pillar")
+    assert "- Newly added pillar" in render_profile_context(copy)
+
+
+@pytest.mark.parametrize("separator", ["\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", "\u2028"])
+def test_parse_ideas_splits_on_every_line_boundary(separator: str) -> None:
+    lines = ["1. First - One | Ops", "2) Second - Two", "3. Third"]
+    parse = video_ideas_module._parse_ideas
+
+    ideas = parse(separator.join(lines), default_pillars=["Default"], max_ideas=3)
+
+    assert ideas == parse("\n".join(lines), default_pillars=["Default"], max_ideas=3)
+    assert [(idea.title, idea.pillar) for idea in ideas] == [
+        ("First", "Ops"),
+        ("Second", "Default"),
+        ("Third", "Default"),
+    ]
+
+
 def test_video_idea_generator_parses_dummy_response(
     profile: InfluencerProfile, mock_observability
 ) -> None:
     generator = VideoIdeaGenerator(observability=mock_observability, target_count=2)
-    ideas = list(generator(profile, request="Focus on lead gen"))
+    ideas = generator(profile, request="Focus on lead gen")
 
     assert len(ideas) == 2
     assert ideas[0].title.startswith("Automating Onboarding")
@@ -67,14 +136,38 @@ def test_video_idea_generator_parses_dummy_response(
     assert "success stories" in ideas[1].summary
 
 
-def test_video_idea_generator_fallback_without_lm(monkeypatch, profile: InfluencerProfile) -> None:
-    # Prevent configure_lm_from_env from loading LM
-    import influencer_assistant.dspy.video_ideas as video_ideas_module
+def test_video_idea_generator_reads_structured_fields(
+    profile: InfluencerProfile, mock_observability
+) -> None:
+    generator = VideoIdeaGenerator(
+        observability=mock_observability, enable_cache=False, structured=True
+    )
+    with dspy.context(lm=dspy.utils.DummyLM([STRUCTURED_RESPONSE])):
+        ideas = generator(profile, request="Focus on lead gen")
+
+    assert [idea.title for idea in ideas] == [
+        "Automating Onboarding Results",
+        "Turning Views Into Leads",
+    ]
+    assert ideas[0].pillar == "AI tooling deep dives"
+    assert ideas[1].pillar == profile.content_pillars[0]
+
+
+def test_generate_many_returns_ideas_per_profile(
+    profile: InfluencerProfile, mock_observability
+) -> None:
+    other = profile.model_copy(update={"handle": "@other"})
+
+    generator = VideoIdeaGenerator(observability=mock_observability, target_count=1)
+    results = asyncio.run(generator.generate_many([profile, other], request="Batch"))
 
-    monkeypatch.setattr(video_ideas_module, "configure_lm_from_env", lambda: False)
+    assert len(results) == 2
+    assert all(ideas[0].pillar == "AI tooling deep dives" for ideas in results)
 
-    dspy.settings.configure(lm=None)
 
+def test_video_idea_generator_fallback_without_lm(
+    monkeypatch, no_lm, profile: InfluencerProfile
+) -> None:
     captured: dict[str, list[dict]] = {"calls": []}
 
     def _capture(**kwargs):
@@ -84,10 +177,113 @@ def test_video_idea_generator_fallback_without_lm(monkeypatch, profile: Influenc
     monkeypatch.setattr(observability, "log_generation", _capture)
 
     generator = VideoIdeaGenerator(observability=observability, target_count=2)
-    ideas = list(generator(profile, request="Fallback please"))
+    ideas = generator(profile, request="Fallback please")
 
     assert len(ideas) == 2
     assert all(idea.pillar for idea in ideas)
     assert captured["calls"]
     # metadata items are passed as **kwargs to log_generation
     assert captured["calls"][0]["fallback_reason"] == "no_lm"
+
+
+def test_video_idea_generator_reuses_cached_prediction(
+    monkeypatch, profile: InfluencerProfile, mock_observability
+) -> None:
+    monkeypatch.setattr(video_ideas_module, "_PREDICTION_CACHE", video_ideas_module.OrderedDict())
+
+    generator = VideoIdeaGenerator(observability=mock_observability, target_count=2)
+    with dspy.context(lm=one_shot_lm()):
+        first = generator(profile, request="Cache me")
+        second = generator(profile, request="Cache me")
+
+    assert first == second
+    assert len(video_ideas_module._PREDICTION_CACHE) == 1
+
+
+def test_video_idea_generator_cache_misses_after_demos_change(
+    monkeypatch, profile: InfluencerProfile, mock_observability
+) -> None:
+    monkeypatch.setattr(video_ideas_module, "_PREDICTION_CACHE", video_ideas_module.OrderedDict())
+
+    generator = VideoIdeaGenerator(observability=mock_observability, target_count=1)
+    before = {"response": "1. Before - Old answer | AI tooling deep dives"}
+    after = {"response": "1. After - Recompiled answer | AI tooling deep dives"}
+    with dspy.context(lm=dspy.utils.DummyLM([before])):
+        first = generator(profile, request="Cache me")
+
+    # Simulates compiling/teleprompting the generator after its first call.
+    generator.predict.demos = [
+        dspy.Example(profile_context="ctx", request="req", response=after["response"])
+    ]
+    with dspy.context(lm=dspy.utils.DummyLM([after])):
+        second = generator(profile, request="Cache me")
+
+    assert first[0].title == "Before"
+    assert second[0].title == "After"
+    assert len(video_ideas_module._PREDICTION_CACHE) == 2
+
+
+def test_video_idea_generator_cache_misses_for_differently_configured_lm(
+    monkeypatch, profile: InfluencerProfile, mock_observability
+) -> None:
+    monkeypatch.setattr(video_ideas_module, "_PREDICTION_CACHE", video_ideas_module.OrderedDict())
+
+    generator = VideoIdeaGenerator(observability=mock_observability, target_count=1)
+    cold = dspy.utils.DummyLM([{"response": "1. Cold - Low temperature | AI tooling deep dives"}])
+    hot = dspy.utils.DummyLM([{"response": "1. Hot - High temperature | AI tooling deep dives"}])
+    hot.kwargs = {**hot.kwargs, "temperature": 1.5}
+    with dspy.context(lm=cold):
+        first = generator(profile, request="Cache me")
+    with dspy.context(lm=hot):
+        second = generator(profile, request="Cache me")
+
+    assert (first[0].title, second[0].title) == ("Cold", "Hot")
+
+
+@pytest.mark.parametrize(
+    ("base_url", "expected"), [(None, {"prompt_cache_key": "creator-1"}), ("http://proxy/v1", {})]
+)
+def test_predict_sends_prompt_cache_key_only_to_default_endpoint(
+    monkeypatch, mock_observability, base_url, expected
+) -> None:
+    if base_url is None:
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    else:
+        monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    generator = VideoIdeaGenerator(observability=mock_observability, target_count=1)
+    configs = []
+    monkeypatch.setattr(
+        generator, "predict", lambda **kwargs: configs.append(kwargs["config"]) or dspy.Prediction()
+    )
+    lm = dspy.utils.DummyLM([])
+    lm.model = "openai/gpt-4o-mini"
+
+    with dspy.context(lm=lm):
+        generator._predict("context", "request", "creator-1")
+
+    assert configs == [expected]
+
+
+def test_video_idea_generator_reuses_semantic_cache_for_paraphrases(
+    profile: InfluencerProfile, mock_observability
+) -> None:
+    vectors = {
+        "Focus on lead gen": [1.0, 0.0],
+        "Lead generation focus please": [0.99, 0.05],
+        "Something unrelated": [0.0, 1.0],
+    }
+    cache = SemanticIdeaCache(lambda texts: [vectors[t] for t in texts], threshold=0.9)
+    generator = VideoIdeaGenerator(
+        observability=mock_observability,
+        target_count=2,
+        enable_cache=False,
+        semantic_cache=cache,
+    )
+
+    with dspy.context(lm=one_shot_lm()):
+        first = generator(profile, request="Focus on lead gen")
+        # A paraphrase must be served from the cache rather than the exhausted LM.
+        paraphrased = generator(profile, request="Lead generation focus please")
+
+    assert paraphrased == first
+    assert cache.lookup((profile.creator_id, 2, False), cache.embed("Something unrelated")) is None
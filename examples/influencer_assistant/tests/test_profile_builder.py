@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict
 
 import pytest
+from pydantic import ValidationError
 
 from influencer_assistant.profile import InfluencerProfile, InfluencerProfileBuilder
 
@@ -20,16 +20,31 @@ FIXTURES = [
 ]
 
 
-@pytest.fixture(params=FIXTURES)
-def portfolio_inputs(request) -> Dict:
-    fixture_path: Path = request.param
-    return json.loads(fixture_path.read_text())
+@pytest.fixture(scope="session")
+def parsed_fixtures(load_fixture) -> Dict[Path, Dict]:
+    return {path: load_fixture(path.name) for path in FIXTURES}
 
 
-def test_builds_normalized_profile(portfolio_inputs: Dict[str, object]) -> None:
-    builder = InfluencerProfileBuilder(llm_runner=None)
+# Payloads and built profiles are shared across tests; none of the tests mutate them.
+@pytest.fixture(scope="module", params=FIXTURES)
+def fixture_path(request) -> Path:
+    return request.param
 
-    profile = builder.build(portfolio_inputs)
+
+@pytest.fixture(scope="module")
+def portfolio_inputs(fixture_path: Path, parsed_fixtures: Dict[Path, Dict]) -> Dict:
+    return parsed_fixtures[fixture_path]
+
+
+@pytest.fixture(scope="module")
+def built_profile(fixture_path: Path, profile_for) -> InfluencerProfile:
+    return profile_for(fixture_path.name)
+
+
+def test_builds_normalized_profile(
+    portfolio_inputs: Dict[str, object], built_profile: InfluencerProfile
+) -> None:
+    profile = built_profile
 
     assert isinstance(profile, InfluencerProfile)
     assert profile.creator_id
@@ -40,14 +55,12 @@ def test_builds_normalized_profile(portfolio_inputs: Dict[str, object]) -> None:
     assert profile.operations is not None
     assert profile.community is not None
     assert profile.raw["creator_identity"]["creator_id"] == profile.creator_id
+    assert profile.raw is portfolio_inputs  # stored without a validation copy
 
 
-def test_operations_and_community_sections_populate(portfolio_inputs: Dict[str, object]) -> None:
-    builder = InfluencerProfileBuilder()
-    profile = builder.build(portfolio_inputs)
-
-    operations = profile.operations
-    community = profile.community
+def test_operations_and_community_sections_populate(built_profile: InfluencerProfile) -> None:
+    operations = built_profile.operations
+    community = built_profile.community
 
     # Operations should include either team composition or integrations
     assert set(operations.keys()) >= {"editor_pod", "integrations"}
@@ -58,9 +71,10 @@ def test_operations_and_community_sections_populate(portfolio_inputs: Dict[str,
     assert community.get("pending_replies") >= 0
 
 
-def test_experiments_and_assets_roundtrip(portfolio_inputs: Dict[str, object]) -> None:
-    builder = InfluencerProfileBuilder()
-    profile = builder.build(portfolio_inputs)
+def test_experiments_and_assets_roundtrip(
+    portfolio_inputs: Dict[str, object], built_profile: InfluencerProfile
+) -> None:
+    profile = built_profile
 
     # Experiments list should match raw payload counts
     raw_experiments = portfolio_inputs.get("experiments", [])
@@ -76,10 +90,21 @@ def test_experiments_and_assets_roundtrip(portfolio_inputs: Dict[str, object]) -
         assert asset["url"].startswith("http")
 
 
-def test_risk_detection_flags_cadence_issue() -> None:
-    inputs = json.loads((FIXTURES[0]).read_text())
-    builder = InfluencerProfileBuilder()
-
-    profile = builder.build(inputs)
+def test_risk_detection_flags_cadence_issue(profile_for) -> None:
+    profile = profile_for(FIXTURES[0].name)
 
     assert any("cadence" in risk.lower() for risk in profile.risks)
+
+
+def test_build_validates_unless_opted_out(
+    portfolio_inputs: Dict[str, object],
+    built_profile: InfluencerProfile,
+    builder: InfluencerProfileBuilder,
+) -> None:
+    assert built_profile == builder.build(portfolio_inputs)
+    assert built_profile == builder.build(portfolio_inputs, validate=False)
+
+    for identity in ({"creator_id": None}, {"creator_id": "c-1", "name": 5}):
+        dirty = {**portfolio_inputs, "creator_identity": identity}
+        with pytest.raises(ValidationError):
+            builder.build(dirty)
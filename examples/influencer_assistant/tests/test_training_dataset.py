@@ -1,20 +1,26 @@
-from influencer_assistant.training.dataset import build_training_dataset
+import pytest
 
+# Input fields, then the structured idea fields the tuned signature expects.
+REQUIRED_FIELDS = [
+    "profile_context",
+    "request",
+    "idea1_title",
+    "idea1_summary",
+    "idea1_pillar",
+    "idea2_title",
+    "idea2_summary",
+    "idea2_pillar",
+    "idea3_title",
+    "idea3_summary",
+    "idea3_pillar",
+]
 
-def test_dataset_examples_have_inputs_and_targets():
-    examples = build_training_dataset()
-    assert examples, "training dataset should not be empty"
-    for example in examples:
-        # Check input fields
-        assert example.profile_context
-        assert example.request
-        # Check output fields (structured idea format)
-        assert example.idea1_title
-        assert example.idea1_summary
-        assert example.idea1_pillar
-        assert example.idea2_title
-        assert example.idea2_summary
-        assert example.idea2_pillar
-        assert example.idea3_title
-        assert example.idea3_summary
-        assert example.idea3_pillar
+
+def test_dataset_is_not_empty(training_examples):
+    assert training_examples, "training dataset should not be empty"
+
+
+@pytest.mark.parametrize("field", REQUIRED_FIELDS)
+def test_dataset_examples_have_field(training_examples, field):
+    for example in training_examples:
+        assert getattr(example, field), f"{field} missing from {example}"
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("dspy")
+
+import tune_video_ideas  # noqa: E402
+
+
+@pytest.fixture
+def embedder(monkeypatch, tmp_path):
+    """An `_OpenAIEmbedder` whose disk cache lives under `tmp_path`."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(tune_video_ideas, "EMBED_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(tune_video_ideas, "_EMBEDDING_STORES", {})
+    instance = tune_video_ideas._OpenAIEmbedder()
+    yield instance
+    instance.close()
+
+
+def test_embedding_store_round_trips_float16_vectors(tmp_path) -> None:
+    path = tmp_path / "embed-test-f16.sqlite"
+    vector = tune_video_ideas._compact_vector([3.0, 4.0, 0.0])
+    tune_video_ideas._EmbeddingStore(path).put_many([("hello", vector)])
+
+    reopened = tune_video_ideas._EmbeddingStore(path)
+    stored = reopened.get_many(["hello", "missing"])
+
+    assert list(stored) == ["hello"]
+    assert stored["hello"].dtype == np.float16
+    np.testing.assert_array_equal(stored["hello"], vector)
+    np.testing.assert_allclose(stored["hello"].astype(np.float32), [0.6, 0.8, 0.0], atol=1e-3)
+
+
+def test_embedder_reads_vectors_back_from_disk_cache(monkeypatch, embedder) -> None:
+    monkeypatch.setattr(embedder, "embed", lambda texts: [[1.0, 0.0] for _ in texts])
+    assert embedder.ensure(["a", "b", "a"])
+
+    # A fresh embedder over the same cache dir must not call the API again.
+    monkeypatch.setattr(tune_video_ideas, "_EMBEDDING_STORES", {})
+    second = tune_video_ideas._OpenAIEmbedder()
+    monkeypatch.setattr(second, "embed", lambda texts: pytest.fail(f"re-embedded {texts}"))
+    try:
+        assert second.ensure(["a", "b"])
+        np.testing.assert_array_equal(second.get("b"), embedder.get("b"))
+    finally:
+        second.close()
+
+
+def test_embed_chunks_requests_and_preserves_order(monkeypatch, embedder) -> None:
+    monkeypatch.setattr(tune_video_ideas, "EMBED_BATCH_SIZE", 2)
+    chunks = []
+
+    def fake_chunk(texts):
+        chunks.append(list(texts))
+        return [[float(text)] for text in texts]
+
+    monkeypatch.setattr(embedder, "_embed_chunk", fake_chunk)
+
+    assert embedder.embed(["1", "2", "3", "4", "5"]) == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(chunks) == [["1", "2"], ["3", "4"], ["5"]]
+
+    # A failed chunk fails the whole call so callers fall back.
+    monkeypatch.setattr(embedder, "_embed_chunk", lambda texts: [] if "3" in texts else texts)
+    assert embedder.embed(["1", "2", "3", "4"]) == []
+
+
+def _rate_limited(headers):
+    return SimpleNamespace(response=SimpleNamespace(status_code=429, headers=headers))
+
+
+def test_retry_delay_honours_retry_after_for_429_only() -> None:
+    assert tune_video_ideas._retry_delay(_rate_limited({"Retry-After": "3"}), 0) == 3.0
+    assert tune_video_ideas._retry_delay(_rate_limited({}), 2) == 4.0
+    assert (
+        tune_video_ideas._retry_delay(_rate_limited({}), tune_video_ideas._EMBED_MAX_RETRIES)
+        is None
+    )
+
+    server_error = SimpleNamespace(response=SimpleNamespace(status_code=500, headers={}))
+    assert tune_video_ideas._retry_delay(server_error, 0) is None
+
+
+def _ideas(*lines: str) -> SimpleNamespace:
+    return SimpleNamespace(response="\n".join(lines))
+
+
+def test_match_count_finds_optimal_assignment_where_greedy_does_not() -> None:
+    # Greedy would pair expected line 0 with its best column 0, leaving line 1
+    # (which only clears the threshold on column 0) unmatched.
+    sims = np.array([[1.0, 0.8], [0.7, 0.1]])
+    assert tune_video_ideas._match_count(sims, 0.65) == 2
+    assert tune_video_ideas._match_count(sims.T, 0.65) == 2
+
+
+def test_jaccard_matrix_handles_lines_without_tokens() -> None:
+    scores = tune_video_ideas._jaccard_matrix(["!!!", "gear review"], ["???", "gear review"])
+    np.testing.assert_array_equal(scores, [[0.0, 0.0], [0.0, 1.0]])
+    np.testing.assert_array_equal(tune_video_ideas._jaccard_matrix(["!!!"], ["???"]), [[0.0]])
+
+
+def test_similarity_metric_scores_against_expected_line_count() -> None:
+    metric = tune_video_ideas.similarity_metric
+    lines = ("1. Budget desk setup", "2. Cable management tips", "3. Monitor arm review")
+
+    assert metric(_ideas(*lines), _ideas(*reversed(lines))) == 1.0
+    assert metric(_ideas(*lines), _ideas("Cable management tips")) == pytest.approx(1 / 3)
+    assert metric(_ideas("Cable management tips"), _ideas(*lines)) == 1.0
+    assert metric(_ideas(*lines), _ideas()) == 0.0
+    assert metric(_ideas("!!!"), _ideas("???")) == 0.0
+
+
+def _semantic_metric(monkeypatch, embedder, vectors):
+    monkeypatch.setattr(embedder, "embed", lambda texts: [vectors[text] for text in texts])
+    return tune_video_ideas.make_semantic_metric(threshold=0.65, embedder=embedder)
+
+
+def test_semantic_metric_uses_optimal_assignment(monkeypatch, embedder) -> None:
+    vectors = {
+        "first": [1.0, 0.0, 0.0],
+        "second": [0.7, -0.714, 0.0],
+        "alpha": [1.0, 0.0, 0.0],
+        "beta": [0.8, 0.6, 0.0],
+    }
+    metric = _semantic_metric(monkeypatch, embedder, vectors)
+
+    # "first" scores highest against "alpha", but only "first"/"beta" and
+    # "second"/"alpha" match both expected lines.
+    assert metric(_ideas("first", "second"), _ideas("alpha", "beta")) == 1.0
+    assert metric(_ideas("first", "second"), _ideas("alpha")) == 0.5
+
+
+def test_semantic_metric_zero_vectors_never_match(monkeypatch, embedder) -> None:
+    vectors = {"first": [1.0, 0.0], "blank": [0.0, 0.0], "empty": []}
+    metric = _semantic_metric(monkeypatch, embedder, vectors)
+
+    assert metric(_ideas("first"), _ideas("blank")) == 0.0
+    assert metric(_ideas("blank"), _ideas("blank")) == 0.0
+    # Lines without a vector still count towards the expected total.
+    assert metric(_ideas("first", "empty"), _ideas("first")) == 0.5
@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import importlib.util
+from itertools import permutations
 from pathlib import Path
 import os
-import math
-from typing import List, Tuple, Dict, Set
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, List, Optional, TextIO, Tuple, Dict
 from types import SimpleNamespace
 import sys
 
 import dspy
+import numpy as np
+from rapidfuzz import fuzz, process
 
 # Ensure the example's src/ is importable when run directly
 EXAMPLE_ROOT = Path(__file__).resolve().parents[1]
@@ -25,6 +36,11 @@ from influencer_assistant.dspy.video_ideas import (  # noqa: E402
 from influencer_assistant.dspy.config import configure_lm_from_env  # noqa: E402
 from influencer_assistant.training.dataset import build_training_dataset  # noqa: E402
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx ships with the openai/litellm stack
+    httpx = None
+
 try:
     from dspy.teleprompt import BootstrapFewShotWithRandomSearch
 except ImportError as exc:  # pragma: no cover - teleprompt availability depends on DSPy version
@@ -35,10 +51,38 @@ except ImportError as exc:  # pragma: no cover - teleprompt availability depends
 OUTPUT_PATH = Path(__file__).resolve().parents[1] / "prompts" / "video_ideas_optimized.txt"
 REPORT_PATH = Path(__file__).resolve().parents[1] / "prompts" / "video_ideas_tuning_report.md"
 
+# Leading list numbering like "1.", "2)", "3 -".
+_RE_LEADING_NUM = re.compile(r"^\s*\d+[\.)\-\s]*")
+_RE_WS = re.compile(r"\s+")
+_RE_TOKEN = re.compile(r"[^a-z0-9]+")
+
+FUZZY_MATCH_THRESHOLD = 0.6
+
+
+# Per-object memo for `_lines_from_obj`; examples and predictions are not
+# mutated once the teleprompter starts scoring them.
+_LINES_ATTR = "_cached_idea_lines"
+
 
 def _lines_from_obj(obj: object) -> List[str]:
     """Extract up to 3 standardized lines from either structured or text outputs.
 
+    The result is memoized on the object itself (when it has a `__dict__`) and
+    must be treated as read-only.
+    """
+
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is None:
+        return _extract_lines(obj)
+    cached = attrs.get(_LINES_ATTR)
+    if cached is None:
+        cached = attrs[_LINES_ATTR] = _extract_lines(obj)
+    return cached
+
+
+def _extract_lines(obj: object) -> List[str]:
+    """Uncached body of `_lines_from_obj`.
+
     Robust to partially-filled structured outputs: builds a line if at least one
     of title/summary/pillar is present, adding the pillar section only when set.
     Falls back to the free-form `response` text when no structured fields exist.
@@ -79,26 +123,21 @@ def similarity_metric(
     """Fuzzy similarity between expected and predicted idea lists.
 
     - Normalizes numbering/punctuation/case.
-    - Uses both token Jaccard and difflib ratio per line.
-    - Counts a match if max(sim) >= 0.6, then returns fraction matched.
+    - Uses both token Jaccard and RapidFuzz edit-distance ratio per line.
+    - Pairs lines one-to-one so the most pairs reach sim >= 0.6, then returns
+      the fraction of expected lines matched.
     """
 
-    import difflib
-    import re
-
     def normalize_line(s: str) -> str:
         s = s.strip().lower()
         # Drop leading numbering like "1.", "2)", etc.
-        s = re.sub(r"^\s*\d+[\.)\-\s]*", "", s)
+        s = _RE_LEADING_NUM.sub("", s)
         # Unify separators
         s = s.replace(" — ", " - ").replace("–", "-")
         # Collapse whitespace
-        s = re.sub(r"\s+", " ", s)
+        s = _RE_WS.sub(" ", s)
         return s
 
-    def token_set(s: str) -> set[str]:
-        return {t for t in re.split(r"[^a-z0-9]+", s) if t}
-
     expected_lines = [normalize_line(line) for line in _lines_from_obj(example)]
     predicted_lines = [normalize_line(line) for line in _lines_from_obj(prediction)]
 
@@ -107,54 +146,172 @@ def similarity_metric(
     if not predicted_lines:
         return 0.0
 
-    matched = 0
-    used = set()
-    for exp in expected_lines:
-        exp_tokens = token_set(exp)
-        best = 0.0
-        best_idx = -1
-        for i, pred in enumerate(predicted_lines):
-            if i in used:
-                continue
-            pred_tokens = token_set(pred)
-            j = 0.0
-            if exp_tokens or pred_tokens:
-                inter = len(exp_tokens & pred_tokens)
-                union = len(exp_tokens | pred_tokens) or 1
-                j = inter / union
-            r = difflib.SequenceMatcher(None, exp, pred).ratio()
-            score = max(j, r)
-            if score > best:
-                best = score
-                best_idx = i
-        # Count as match if reasonably similar
-        if best >= 0.6:
-            matched += 1
-            used.add(best_idx)
-
-    return matched / max(1, len(expected_lines))
-
-
-def _cosine(a: List[float], b: List[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = 0.0
-    na = 0.0
-    nb = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        na += x * x
-        nb += y * y
-    if na == 0.0 or nb == 0.0:
-        return 0.0
-    return dot / math.sqrt(na * nb)
+    scores = np.maximum(
+        _jaccard_matrix(expected_lines, predicted_lines),
+        _ratio_matrix(expected_lines, predicted_lines),
+    )
+    return _match_count(scores, FUZZY_MATCH_THRESHOLD) / len(expected_lines)
+
+
+def _jaccard_matrix(expected: List[str], predicted: List[str]) -> np.ndarray:
+    """Pairwise token-set Jaccard similarity, expected lines by rows.
+
+    Lines become 0/1 rows over a shared vocabulary, so all intersections come
+    from one matrix product and unions from the row sums.
+    """
+
+    lines = [[t for t in _RE_TOKEN.split(line) if t] for line in expected + predicted]
+    vocab: Dict[str, int] = {}
+    for tokens in lines:
+        for token in tokens:
+            vocab.setdefault(token, len(vocab))
+    members = np.zeros((len(lines), max(1, len(vocab))))
+    for row, tokens in enumerate(lines):
+        members[row, [vocab[token] for token in tokens]] = 1.0
+
+    split = len(expected)
+    inter = members[:split] @ members[split:].T
+    sizes = members.sum(axis=1)
+    union = sizes[:split, None] + sizes[None, split:] - inter
+    return inter / np.maximum(union, 1.0)
+
+
+def _ratio_matrix(expected: List[str], predicted: List[str]) -> np.ndarray:
+    """Pairwise edit-distance similarity in [0, 1], expected lines by rows."""
+
+    # Scores under the cutoff come back as 0, which never counts as a match.
+    ratios = process.cdist(
+        expected,
+        predicted,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_THRESHOLD * 100,
+        dtype=np.float64,
+    )
+    return ratios / 100.0
+
+
+def _match_count(sims: np.ndarray, threshold: float) -> int:
+    """Return the most one-to-one line pairs that can all score >= `threshold`.
+
+    `_lines_from_obj` caps both sides at three lines, so trying every assignment
+    (at most 3! = 6) is exact and cheaper than a general assignment solver.
+    """
+
+    hits = sims >= threshold
+    if hits.shape[0] > hits.shape[1]:
+        hits = hits.T
+    rows, cols = hits.shape
+    return max(
+        int(sum(hits[r, c] for r, c in enumerate(assignment)))
+        for assignment in permutations(range(cols), rows)
+    )
+
+
+EMBED_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "observable-agent"
+
+
+class _EmbeddingStore:
+    """SQLite-backed embedding cache shared across tuning runs.
+
+    Rows are keyed by sha256 of the text, with one database file per embedding
+    model; vectors are stored as packed float16 (see `_compact_vector`).
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Metrics may be scored from DSPy's evaluation threads.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS emb(key BLOB PRIMARY KEY, vec BLOB)")
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, np.ndarray]:
+        by_key = {self._key(text): text for text in texts}
+        if not by_key:
+            return {}
+        placeholders = ",".join("?" * len(by_key))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", list(by_key)
+            ).fetchall()
+        return {by_key[key]: np.frombuffer(blob, dtype=np.float16) for key, blob in rows}
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        rows = [
+            (self._key(text), np.asarray(vec, dtype=np.float16).tobytes()) for text, vec in items
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO emb(key, vec) VALUES (?, ?)", rows)
+
+
+def _compact_vector(vec: List[float]) -> np.ndarray:
+    """Unit-normalize and store at half precision.
+
+    Rounding unit vectors to float16 shifts cosine scores by far less than
+    0.001, well below what the metric thresholds resolve, while memory and the
+    disk cache shrink by half.
+    """
+
+    arr = np.asarray(vec, dtype=np.float32)
+    norm = np.linalg.norm(arr)
+    if norm:
+        arr /= norm
+    return arr.astype(np.float16)
+
+
+_EMBEDDING_STORES: Dict[str, Optional[_EmbeddingStore]] = {}
+
+
+def _embedding_store(model: str) -> Optional[_EmbeddingStore]:
+    """Return the shared on-disk store for `model`, or None if it cannot be opened."""
+
+    if model not in _EMBEDDING_STORES:
+        safe_model = "".join(c if c.isalnum() or c in "-_." else "_" for c in model)
+        try:
+            store: Optional[_EmbeddingStore] = _EmbeddingStore(
+                EMBED_CACHE_DIR / f"embed-{safe_model}-f16.sqlite"
+            )
+        except (OSError, sqlite3.Error) as exc:  # pragma: no cover - cache is best effort
+            print("Embedding disk cache unavailable:", exc)
+            store = None
+        _EMBEDDING_STORES[model] = store
+    return _EMBEDDING_STORES[model]
+
+
+# OpenAI rejects embedding requests with more than 2048 inputs.
+EMBED_BATCH_SIZE = int(os.getenv("OPENAI_EMBED_BATCH_SIZE", "256"))
+EMBED_CONCURRENCY = int(os.getenv("OPENAI_EMBED_CONCURRENCY", "4"))
+_EMBED_MAX_RETRIES = 4
+
+
+def _retry_delay(exc: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited request, or None to give up."""
+
+    response = getattr(exc, "response", None)  # httpx.HTTPStatusError
+    status = getattr(response, "status_code", None) or getattr(exc, "code", None)  # urllib
+    if status != 429 or attempt >= _EMBED_MAX_RETRIES:
+        return None
+    headers = response.headers if response is not None else getattr(exc, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return float(2**attempt)
 
 
 class _OpenAIEmbedder:
     """Tiny, dependency-free embedder using OpenAI's /v1/embeddings API.
 
     Requires OPENAI_API_KEY. Honors OPENAI_BASE_URL and OPENAI_EMBED_MODEL.
-    Caches by exact string to avoid repeated calls.
+    Caches by exact string in memory and on disk (see `EMBED_CACHE_DIR`), so
+    repeated tuning runs do not re-embed the same lines. Requests reuse one
+    keep-alive `httpx` connection (HTTP/2 when `h2` is installed) and fall back
+    to `urllib` without httpx.
     """
 
     def __init__(self) -> None:
@@ -164,51 +321,134 @@ class _OpenAIEmbedder:
         base = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
         self.url = f"{base}/embeddings"
         self.model = os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small")
-        self._cache: Dict[str, List[float]] = {}
+        self._cache: Dict[str, np.ndarray] = {}
+        self._store = _embedding_store(self.model)
+        self._client = None
+        if httpx is not None:
+            self._client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=60.0,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+
+    def ensure(self, texts: List[str]) -> bool:
+        """Make sure every text has a cached vector; return False if embedding failed.
+
+        Duplicates in `texts` are requested once, in first-seen order.
+        """
+
+        missing = list(dict.fromkeys(text for text in texts if text not in self._cache))
+        if missing and self._store is not None:
+            self._cache.update(self._store.get_many(missing))
+            missing = [text for text in missing if text not in self._cache]
+        if not missing:
+            return True
+        vecs = self.embed(missing)
+        if not vecs or len(vecs) != len(missing):
+            return False
+        arrays = [_compact_vector(vec) for vec in vecs]
+        self._cache.update(zip(missing, arrays))
+        if self._store is not None:
+            self._store.put_many(zip(missing, arrays))
+        return True
 
     def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed `texts` in order, sending `EMBED_BATCH_SIZE` inputs per request.
+
+        Returns an empty list if any chunk fails, which triggers fallback logic.
+        """
+
+        chunks = [
+            texts[start : start + EMBED_BATCH_SIZE]
+            for start in range(0, len(texts), EMBED_BATCH_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(EMBED_CONCURRENCY, len(chunks))) as pool:
+                results = list(pool.map(self._embed_chunk, chunks))
+        else:
+            results = [self._embed_chunk(chunk) for chunk in chunks]
+        if any(len(vecs) != len(chunk) for vecs, chunk in zip(results, chunks)):
+            return []
+        return [vec for vecs in results for vec in vecs]
+
+    def _embed_chunk(self, texts: List[str]) -> List[List[float]]:
+        payload = {"model": self.model, "input": texts}
+        for attempt in range(_EMBED_MAX_RETRIES + 1):
+            try:
+                if self._client is not None:
+                    resp = self._client.post(self.url, json=payload)
+                    resp.raise_for_status()
+                    obj = resp.json()
+                else:
+                    obj = self._post_urllib(payload)
+                return [d.get("embedding", []) for d in obj.get("data", [])]
+            except Exception as exc:  # pragma: no cover
+                delay = _retry_delay(exc, attempt)
+                if delay is None:
+                    return []
+                time.sleep(delay)
+        return []
+
+    def _post_urllib(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         import json as _json
         from urllib import request as _req
-        from urllib.error import HTTPError, URLError
 
-        payload = {"model": self.model, "input": texts}
-        data = _json.dumps(payload).encode("utf-8")
-        req = _req.Request(self.url, data=data, method="POST")
+        req = _req.Request(self.url, data=_json.dumps(payload).encode("utf-8"), method="POST")
         req.add_header("Content-Type", "application/json")
         req.add_header("Authorization", f"Bearer {self.api_key}")
-        try:
-            with _req.urlopen(req, timeout=60) as resp:
-                body = resp.read()
-            obj = _json.loads(body.decode("utf-8"))
-            vectors = [d.get("embedding", []) for d in obj.get("data", [])]
-            return vectors
-        except (HTTPError, URLError, TimeoutError, Exception):  # pragma: no cover
-            # On any failure, return empty list to trigger fallback logic
-            return []
+        with _req.urlopen(req, timeout=60) as resp:
+            return _json.loads(resp.read().decode("utf-8"))
 
-    def get(self, text: str) -> List[float]:
-        vec = self._cache.get(text)
-        if vec is not None:
-            return vec
-        vecs = self.embed([text])
-        if vecs:
-            self._cache[text] = vecs[0]
-            return vecs[0]
-        return []
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
 
+    def get(self, text: str) -> np.ndarray:
+        if self.ensure([text]):
+            return self._cache[text]
+        return np.zeros(0, dtype=np.float16)
 
-def _normalize_for_semantic(s: str) -> str:
-    import re
 
+def _prewarm_embeddings(embedder: _OpenAIEmbedder, trainset: List[dspy.Example]) -> None:
+    """Embed every expected training line up front, in bulk requests.
+
+    The metric is scored once per (example, prediction) pair during tuning, so
+    with the labels already cached each call only has to embed predicted lines.
+    """
+
+    expected = sorted(
+        {
+            _normalize_for_semantic(line)
+            for ex in trainset
+            for line in _lines_from_obj(ex)
+            if line.strip()
+        }
+    )
+    embedder.ensure(expected)
+
+
+def _normalize_for_semantic(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r"^\s*\d+[\.)\-\s]*", "", s)  # drop leading numbers
+    s = _RE_LEADING_NUM.sub("", s)
     s = s.replace(" — ", " - ").replace("–", "-")
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_WS.sub(" ", s)
     return s
 
 
-def make_semantic_metric(threshold: float = 0.65):
-    embedder = _OpenAIEmbedder()
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Upcast to float32 and L2-normalize each row; all-zero rows stay zero."""
+
+    matrix = matrix.astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0.0, 1.0, norms)
+
+
+def make_semantic_metric(threshold: float = 0.65, embedder: Optional[_OpenAIEmbedder] = None):
+    if embedder is None:
+        embedder = _OpenAIEmbedder()
 
     def metric(
         example: dspy.Example, prediction: dspy.Prediction, trace: object | None = None
@@ -219,45 +459,89 @@ def make_semantic_metric(threshold: float = 0.65):
         pred_lines = [_normalize_for_semantic(line) for line in pred_lines_raw]
         if not exp_lines or not pred_lines:
             return 0.0
-        # Batch-embed all unique lines not yet in cache for efficiency
-        unique: List[str] = []
-        seen: Set[str] = set()
-        for line in exp_lines + pred_lines:
-            if line not in seen and line not in embedder._cache:
-                seen.add(line)
-                unique.append(line)
-        if unique:
-            vecs = embedder.embed(unique)
-            if vecs and len(vecs) == len(unique):
-                for line, v in zip(unique, vecs):
-                    embedder._cache[line] = v
-            else:
-                # Embedding failed; fall back to fuzzy metric to avoid zeroing
+        # Batch-embed all lines not yet cached (in memory or on disk)
+        if embedder.ensure(exp_lines + pred_lines):
+            # Lines the API returned no vector for cannot match; expected ones
+            # still count in the denominator.
+            exp_vecs = [v for line in exp_lines if (v := embedder._cache[line]).size]
+            pred_vecs = [v for line in pred_lines if (v := embedder._cache[line]).size]
+            if exp_vecs and pred_vecs:
+                sims = _unit_rows(np.stack(exp_vecs)) @ _unit_rows(np.stack(pred_vecs)).T
+                return _match_count(sims, threshold) / len(exp_lines)
+
+        # Embedding failed; fall back to fuzzy metric to avoid zeroing
+        try:
+            return similarity_metric(example, prediction, trace)
+        except Exception:
+            return 0.0
+
+    return metric
+
+
+_EVAL_CONCURRENCY = 5
+
+
+def _predict_all(predict: Any, examples: List[dspy.Example]) -> List[object]:
+    """Run `predict` on every example concurrently, preserving input order.
+
+    Failed predictions become an empty namespace, which every metric scores as 0.
+    """
+
+    async def run() -> List[object]:
+        semaphore = asyncio.Semaphore(_EVAL_CONCURRENCY)
+        apredict = dspy.asyncify(predict)
+
+        async def _one(ex: dspy.Example) -> object:
+            async with semaphore:
                 try:
-                    return similarity_metric(example, prediction, trace)
+                    return await apredict(
+                        profile_context=getattr(ex, "profile_context", ""),
+                        request=getattr(ex, "request", ""),
+                    )
                 except Exception:
-                    return 0.0
-
-        matched = 0
-        used: set[int] = set()
-        for exp in exp_lines:
-            e = embedder._cache.get(exp, [])
-            best = 0.0
-            best_i = -1
-            for i, ptxt in enumerate(pred_lines):
-                if i in used:
-                    continue
-                p = embedder._cache.get(ptxt, [])
-                sim = _cosine(e, p)
-                if sim > best:
-                    best = sim
-                    best_i = i
-            if best >= threshold and best_i >= 0:
-                matched += 1
-                used.add(best_i)
-        return matched / max(1, len(exp_lines))
+                    return SimpleNamespace()
 
-    return metric
+        return list(await asyncio.gather(*(_one(ex) for ex in examples)))
+
+    return asyncio.run(run())
+
+
+@dataclass(slots=True)
+class _ExampleResult:
+    example: dspy.Example
+    baseline: object
+    tuned: object
+    baseline_score: float
+    tuned_score: float
+
+
+def _safe_score(metric: Any, example: dspy.Example, prediction: object) -> float:
+    try:
+        return metric(example, prediction, None)
+    except Exception:
+        return 0.0
+
+
+def _write_report(out: TextIO, header: List[str], results: Iterable[_ExampleResult]) -> None:
+    """Write the Before/After Markdown report, one example at a time."""
+
+    out.write("# Video Ideas Tuning Report\n\n")
+    out.writelines(f"- {item}\n" for item in header)
+    for idx, result in enumerate(results, start=1):
+        ex = result.example
+        out.write(f"\n## Example {idx}\n\n")
+        out.write(f"**Request**\n\n{str(getattr(ex, 'request', '')).strip()}\n\n")
+        out.write(f"**Expected (label)**\n\n{str(getattr(ex, 'response', '')).strip()}\n")
+        for label, pred, score in (
+            ("Baseline", result.baseline, result.baseline_score),
+            ("Tuned", result.tuned, result.tuned_score),
+        ):
+            ideas = "\n".join(_lines_from_obj(pred)).strip()
+            out.write(f"\n**{label} score:** {score:.2%}\n\n```\n{ideas}\n```\n")
+
+
+def _prompt_length(ex: dspy.Example) -> int:
+    return len(getattr(ex, "request", "")) + len(getattr(ex, "profile_context", ""))
 
 
 def main(
@@ -266,29 +550,26 @@ def main(
     metric_name: str,
     semantic_threshold: float,
     report_output: Path,
+    trainset: Optional[List[dspy.Example]] = None,
 ) -> None:
     if not configure_lm_from_env():
         raise SystemExit(
             "No LM configured. Set OPENAI_* environment variables before running tuning."
         )
 
-    trainset = build_training_dataset()
+    if trainset is None:
+        trainset = build_training_dataset()
     # Capture baseline predictions before tuning for each labeled example
     baseline_predict = dspy.Predict(VideoIdeasStructuredSignature)
-    baseline_results: List[Tuple[dspy.Example, object]] = []
-    for ex in trainset:
-        try:
-            pred0 = baseline_predict(
-                profile_context=getattr(ex, "profile_context", ""),
-                request=getattr(ex, "request", ""),
-            )
-            baseline_results.append((ex, pred0))
-        except Exception:
-            baseline_results.append((ex, SimpleNamespace()))
+    baseline_results: List[Tuple[dspy.Example, object]] = list(
+        zip(trainset, _predict_all(baseline_predict, trainset))
+    )
     # Choose metric
     metric_func = similarity_metric
     if metric_name == "semantic":
-        metric_func = make_semantic_metric(threshold=semantic_threshold)
+        embedder = _OpenAIEmbedder()
+        _prewarm_embeddings(embedder, trainset)
+        metric_func = make_semantic_metric(threshold=semantic_threshold, embedder=embedder)
 
     optimizer = BootstrapFewShotWithRandomSearch(
         metric=metric_func,
@@ -299,9 +580,17 @@ def main(
         max_errors=10,
     )
 
+    # Group similar-sized prompts so consecutive LM calls have similar prefill
+    # cost. Only the compile order changes; the report keeps dataset order.
+    # Opt-in with SORT_TRAIN_BY_LEN=1: the optimizer's demo bootstrapping sees
+    # examples in this order, so sorting changes which demos get selected.
+    compile_set = trainset
+    if os.getenv("SORT_TRAIN_BY_LEN", "0") == "1":
+        compile_set = sorted(trainset, key=_prompt_length)
+
     # Pass the training set to the optimizer call/compile step, not the constructor.
     tuned_predict = optimizer.compile(
-        student=dspy.Predict(VideoIdeasStructuredSignature), trainset=trainset
+        student=dspy.Predict(VideoIdeasStructuredSignature), trainset=compile_set
     )
 
     # Write tuned guidance for later reuse. Not all DSPy versions expose a raw
@@ -360,56 +649,32 @@ def main(
 
     # Write a Before/After markdown report with scores using the chosen metric
     try:
-        metric_for_report = metric_func
-        report_lines: List[str] = []
         lm = getattr(dspy.settings, "lm", None)
-        model_name = getattr(lm, "model", None)
-        report_lines.append("# Video Ideas Tuning Report")
-        report_lines.append("")
-        report_lines.append(f"- Model: {model_name}")
-        report_lines.append(f"- Metric: {metric_name}")
+        header = [f"Model: {getattr(lm, 'model', None)}", f"Metric: {metric_name}"]
         if metric_name == "semantic":
-            report_lines.append(f"- Semantic threshold: {semantic_threshold}")
-        report_lines.append(f"- Candidates: {num_candidates}")
-        report_lines.append("")
-
-        for idx, (ex, base_pred) in enumerate(baseline_results, start=1):
-            tuned_pred = tuned_predict(
-                profile_context=getattr(ex, "profile_context", ""),
-                request=getattr(ex, "request", ""),
+            header.append(f"Semantic threshold: {semantic_threshold}")
+        header.append(f"Candidates: {num_candidates}")
+
+        tuned_preds = _predict_all(tuned_predict, [ex for ex, _ in baseline_results])
+        results = (
+            _ExampleResult(
+                example=ex,
+                baseline=base_pred,
+                tuned=tuned_pred,
+                baseline_score=_safe_score(metric_func, ex, base_pred),
+                tuned_score=_safe_score(metric_func, ex, tuned_pred),
             )
-            base_lines = _lines_from_obj(base_pred)
-            tuned_lines = _lines_from_obj(tuned_pred)
-            try:
-                base_score = metric_for_report(ex, base_pred, None)
-            except Exception:
-                base_score = 0.0
-            try:
-                tuned_score = metric_for_report(ex, tuned_pred, None)
-            except Exception:
-                tuned_score = 0.0
-
-            report_lines.append(f"## Example {idx}")
-            report_lines.append("")
-            report_lines.append("**Request**")
-            report_lines.append("")
-            report_lines.append(str(getattr(ex, "request", "")).strip())
-            report_lines.append("")
-            report_lines.append("**Expected (label)**")
-            report_lines.append("")
-            report_lines.append(str(getattr(ex, "response", "")).strip())
-            report_lines.append("")
-            report_lines.append(f"**Baseline score:** {base_score:.2%}")
-            report_lines.append("")
-            report_lines.append("```\n" + ("\n".join(base_lines)).strip() + "\n```")
-            report_lines.append("")
-            report_lines.append(f"**Tuned score:** {tuned_score:.2%}")
-            report_lines.append("")
-            report_lines.append("```\n" + ("\n".join(tuned_lines)).strip() + "\n```")
-            report_lines.append("")
+            for (ex, base_pred), tuned_pred in zip(baseline_results, tuned_preds)
+        )
 
+        # Stream into a sibling temp file and swap it in at the end: a failure
+        # midway leaves the partial report in the .tmp file and never clobbers
+        # the previous report.
         report_output.parent.mkdir(parents=True, exist_ok=True)
-        report_output.write_text("\n".join(report_lines))
+        partial_path = report_output.with_name(report_output.name + ".tmp")
+        with partial_path.open("w", encoding="utf-8", buffering=1 << 20) as out:
+            _write_report(out, header, results)
+        os.replace(partial_path, report_output)
         print(f"Before/After report saved to {report_output}")
     except Exception as exc:  # pragma: no cover
         print("Failed to write tuning report:", exc)
@@ -453,6 +718,7 @@ if __name__ == "__main__":
         help="Where to save before/after tuning report (Markdown).",
     )
     args = parser.parse_args()
+    trainset = None
     if args.debug:
         # Quick sanity: show LM and a raw prediction before tuning.
         # Ensure we attempt configuration before reporting.
@@ -476,4 +742,5 @@ if __name__ == "__main__":
         args.metric,
         args.semantic_threshold,
         args.report_output,
+        trainset=trainset,
     )
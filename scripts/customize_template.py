@@ -14,11 +14,70 @@ Usage:
 """
 
 import argparse
+import os
 import re
 import shutil
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+# Literal targets are rewritten with str.replace. Only targets that need regex
+# features (classes, anchors, groups, word boundaries) are compiled, once at
+# import; those depending on the old package name are compiled once per run.
+PROJECT_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
+PYPROJECT_NAME = 'name = "observable-agent-starter"'
+VERSION_RE = re.compile(r'version = "[^"]+"')
+DESCRIPTION_RE = re.compile(r'description = "[^"]+"')
+AUTHORS_RE = re.compile(r"authors = \[.*?\]", re.DOTALL)
+PACKAGES = 'packages = ["src/observable_agent_starter"]'
+ENTRY_POINT = 'observable-agent = "observable_agent_starter.cli:main"'
+COVERAGE_SOURCE = 'source = ["src"]'
+
+COVERAGE_FLAGS = "flags: observable-agent-starter"
+COV_ARG = "--cov=observable_agent_starter"
+
+README_TITLE = "# Observable Agent Starter"
+REPO_SLUG = "ammons-datalabs/observable-agent-starter"
+DASHED_NAME = "observable-agent-starter"
+PACKAGE_NAME = "observable_agent_starter"
+DASHED_NAME_WORD_RE = re.compile(r"\bobservable-agent-starter\b")
+
+INIT_VERSION_RE = re.compile(r'__version__ = "[^"]+"')
+INIT_DOCSTRING = '"""Observable Agent Starter - DSPy agent framework with observability."""'
+
+CLI_PROG = 'prog="observable-agent"'
+CLI_VERSION_PRINT = 'print(f"observable-agent v{__version__}")'
+
+MAKE_ROUTING_RE = re.compile(
+    r"^(\s*\$\(PYTHON\) -m observable_agent_starter\.agents\.routing)", re.MULTILINE
+)
+MAKE_API_RE = re.compile(
+    r"^(\s*\$\(VENV\)/bin/uvicorn observable_agent_starter\.servers\.api:app)", re.MULTILINE
+)
+
+EXAMPLE_DEPENDENCY = '"observable-agent-starter",'
+EXAMPLE_DEPENDENCY_RE = re.compile(r'(\s+)"observable-agent-starter",')
+
+
+# Progress messages are buffered and written to stdout in one call by flush_log()
+_log_lines: list[str] = []
+
+
+def log(message: str = "") -> None:
+    """Queue a progress message for the next `flush_log`."""
+    _log_lines.append(message)
+
+
+def flush_log() -> None:
+    """Write all queued progress messages at once."""
+    if _log_lines:
+        sys.stdout.write("\n".join(_log_lines) + "\n")
+        sys.stdout.flush()
+        _log_lines.clear()
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
@@ -27,9 +86,9 @@ def get_project_root() -> Path:
 
 def validate_project_name(name: str) -> bool:
     """Validate that project name is a valid Python package name."""
-    if not re.match(r"^[a-z][a-z0-9_]*$", name):
-        print(f"Error: Project name '{name}' must be lowercase, start with a letter,")
-        print("and contain only letters, numbers, and underscores.")
+    if not PROJECT_NAME_RE.match(name):
+        log(f"Error: Project name '{name}' must be lowercase, start with a letter,")
+        log("and contain only letters, numbers, and underscores.")
         return False
     return True
 
@@ -40,296 +99,246 @@ def rename_package_directory(old_name: str, new_name: str, root: Path) -> bool:
     new_path = root / "src" / new_name
 
     if not old_path.exists():
-        print(f"Error: Source directory {old_path} does not exist.")
+        log(f"Error: Source directory {old_path} does not exist.")
         return False
 
     if new_path.exists():
-        print(f"Error: Target directory {new_path} already exists.")
+        log(f"Error: Target directory {new_path} already exists.")
         return False
 
-    print(f"Renaming {old_path} -> {new_path}")
+    log(f"Renaming {old_path} -> {new_path}")
     shutil.move(str(old_path), str(new_path))
     return True
 
 
-def update_imports_in_file(file_path: Path, old_name: str, new_name: str) -> None:
-    """Update import statements in a single file."""
-    content = file_path.read_text()
-
-    # Replace import statements
-    patterns = [
-        (rf"from {old_name}", f"from {new_name}"),
-        (rf"import {old_name}", f"import {new_name}"),
-    ]
-
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content)
-
-    file_path.write_text(content)
-
-
-def update_all_imports(old_name: str, new_name: str, root: Path) -> None:
-    """Update all import statements throughout the codebase."""
-    print("\nUpdating imports in Python files...")
+def write_if_changed(path: Path, original: str, content: str) -> bool:
+    """Write `content` to `path` unless it equals `original`; return whether it wrote."""
+    if content == original:
+        return False
+    path.write_text(content)
+    return True
 
-    # Directories to exclude
-    exclude_dirs = {".git", ".venv", "venv", "__pycache__", ".pytest_cache", "node_modules", ".tox"}
 
-    for py_file in root.rglob("*.py"):
-        # Skip files in excluded directories
-        if any(excluded in py_file.parts for excluded in exclude_dirs):
-            continue
+def rewrite_imports(content: str, old_name: str, new_name: str) -> str:
+    """Update import statements in Python source."""
+    # Most files never mention the package; skip them without any replacement scans.
+    if old_name not in content:
+        return content
 
-        update_imports_in_file(py_file, old_name, new_name)
-        print(f"  Updated: {py_file.relative_to(root)}")
+    content = content.replace(f"from {old_name}", f"from {new_name}")
+    return content.replace(f"import {old_name}", f"import {new_name}")
 
 
-def update_pyproject_toml(
-    new_name: str, author: str, email: str, description: str, root: Path
-) -> None:
+def pyproject_content(
+    content: str, new_name: str, author: str, email: str, description: str
+) -> str:
     """Update pyproject.toml with new project metadata."""
-    print("\nUpdating pyproject.toml...")
-
-    pyproject_path = root / "pyproject.toml"
-    content = pyproject_path.read_text()
-
     # Update name
-    content = re.sub(r'name = "observable-agent-starter"', f'name = "{new_name}"', content)
+    content = content.replace(PYPROJECT_NAME, f'name = "{new_name}"')
 
     # Update version to 0.1.0 (fresh start)
-    content = re.sub(r'version = "[^"]+"', 'version = "0.1.0"', content)
+    content = VERSION_RE.sub('version = "0.1.0"', content)
 
     # Update description
-    content = re.sub(r'description = "[^"]+"', f'description = "{description}"', content)
+    content = DESCRIPTION_RE.sub(f'description = "{description}"', content)
 
     # Update author
-    content = re.sub(
-        r"authors = \[.*?\]",
+    content = AUTHORS_RE.sub(
         f'authors = [\n  {{ name = "{author}", email = "{email}" }}\n]',
         content,
-        flags=re.DOTALL,
     )
 
     # Update package path (Hatch uses src-layout)
-    content = re.sub(
-        r'packages = \["src/observable_agent_starter"\]', f'packages = ["src/{new_name}"]', content
-    )
+    content = content.replace(PACKAGES, f'packages = ["src/{new_name}"]')
 
     # Update script entry point
-    content = re.sub(
-        r'observable-agent = "observable_agent_starter\.cli:main"',
-        f'{new_name} = "{new_name}.cli:main"',
-        content,
-    )
+    content = content.replace(ENTRY_POINT, f'{new_name} = "{new_name}.cli:main"')
 
     # Update coverage source
-    content = re.sub(r'source = \["src"\]', f'source = ["src/{new_name}"]', content)
+    return content.replace(COVERAGE_SOURCE, f'source = ["src/{new_name}"]')
 
-    pyproject_path.write_text(content)
-    print("  Updated: pyproject.toml")
 
-
-def update_ci_workflow(new_name: str, root: Path) -> None:
+def ci_workflow_content(content: str, new_name: str) -> str:
     """Update GitHub Actions CI workflow."""
-    print("\nUpdating CI workflow...")
-
-    ci_path = root / ".github" / "workflows" / "ci.yml"
-    if not ci_path.exists():
-        print(f"  Warning: {ci_path} not found, skipping")
-        return
-
-    content = ci_path.read_text()
-
     # Update coverage flags
-    content = re.sub(r"flags: observable-agent-starter", f"flags: {new_name}", content)
+    content = content.replace(COVERAGE_FLAGS, f"flags: {new_name}")
 
     # Update --cov argument
-    content = re.sub(r"--cov=observable_agent_starter", f"--cov={new_name}", content)
-
-    ci_path.write_text(content)
-    print("  Updated: .github/workflows/ci.yml")
+    return content.replace(COV_ARG, f"--cov={new_name}")
 
 
-def update_readme(new_name: str, author: str, root: Path) -> None:
+def readme_content(content: str, new_name: str, author: str) -> str:
     """Update README.md badges and references."""
-    print("\nUpdating README.md...")
-
-    readme_path = root / "README.md"
-    content = readme_path.read_text()
-
     # Update title
-    content = re.sub(
-        r"# Observable Agent Starter", f'# {new_name.replace("_", " ").title()}', content, count=1
-    )
+    content = content.replace(README_TITLE, f"# {new_name.replace('_', ' ').title()}", 1)
 
     # Update repo references in badges (update these with your actual GitHub username)
     # Note: User will need to manually update the GitHub org/username
-    content = re.sub(r"ammons-datalabs/observable-agent-starter", f"{author}/{new_name}", content)
+    content = content.replace(REPO_SLUG, f"{author}/{new_name}")
 
     # Update package name references
-    content = re.sub(r"observable-agent-starter", new_name, content)
-
-    content = re.sub(r"observable_agent_starter", new_name, content)
+    content = content.replace(DASHED_NAME, new_name)
 
-    readme_path.write_text(content)
-    print("  Updated: README.md")
+    return content.replace(PACKAGE_NAME, new_name)
 
 
-def update_init_version(new_name: str, root: Path) -> None:
-    """Update __version__ in __init__.py."""
-    print("\nUpdating __init__.py version...")
-
-    init_path = root / "src" / new_name / "__init__.py"
-    if not init_path.exists():
-        print(f"  Warning: {init_path} not found, skipping")
-        return
-
-    content = init_path.read_text()
-
+def init_content(content: str, new_name: str) -> str:
+    """Update __version__ and the package docstring in __init__.py."""
     # Update version to 0.1.0
-    content = re.sub(r'__version__ = "[^"]+"', '__version__ = "0.1.0"', content)
+    content = INIT_VERSION_RE.sub('__version__ = "0.1.0"', content)
 
-    init_path.write_text(content)
-    print(f"  Updated: {init_path.relative_to(root)}")
+    # Update docstring to be generic
+    return content.replace(
+        INIT_DOCSTRING, f'"""{new_name} - LLM agent with Langfuse observability."""'
+    )
 
 
-def update_cli(new_name: str, root: Path) -> None:
+def cli_content(content: str, new_name: str) -> str:
     """Update CLI prog name and print statements."""
-    print("\nUpdating CLI prog name...")
-
-    cli_path = root / "src" / new_name / "cli.py"
-    if not cli_path.exists():
-        print(f"  Warning: {cli_path} not found, skipping")
-        return
-
-    content = cli_path.read_text()
-
     # Update prog argument in ArgumentParser
-    content = re.sub(r'prog="observable-agent"', f'prog="{new_name}"', content)
+    content = content.replace(CLI_PROG, f'prog="{new_name}"')
 
     # Update print statement
-    content = re.sub(
-        r'print\(f"observable-agent v\{__version__\}"\)',
-        f'print(f"{new_name} v{{__version__}}")',
-        content,
-    )
+    return content.replace(CLI_VERSION_PRINT, f'print(f"{new_name} v{{__version__}}")')
 
-    cli_path.write_text(content)
-    print(f"  Updated: {cli_path.relative_to(root)}")
 
-
-def update_makefile(new_name: str, root: Path) -> None:
+def makefile_content(content: str, new_name: str) -> str:
     """Update Makefile coverage target and remove non-existent modules."""
-    print("\nUpdating Makefile...")
-
-    makefile_path = root / "Makefile"
-    if not makefile_path.exists():
-        print(f"  Warning: {makefile_path} not found, skipping")
-        return
-
-    content = makefile_path.read_text()
-
     # Update coverage target
-    content = re.sub(r"--cov=observable_agent_starter", f"--cov={new_name}", content)
+    content = content.replace(COV_ARG, f"--cov={new_name}")
 
     # Comment out non-existent module references
-    content = re.sub(
-        r"^(\s*\$\(PYTHON\) -m observable_agent_starter\.agents\.routing)",
-        r"# \1  # Template: Customize with your module",
-        content,
-        flags=re.MULTILINE,
-    )
-
-    content = re.sub(
-        r"^(\s*\$\(VENV\)/bin/uvicorn observable_agent_starter\.servers\.api:app)",
-        r"# \1  # Template: Customize with your module",
-        content,
-        flags=re.MULTILINE,
-    )
+    content = MAKE_ROUTING_RE.sub(r"# \1  # Template: Customize with your module", content)
 
-    makefile_path.write_text(content)
-    print("  Updated: Makefile")
+    return MAKE_API_RE.sub(r"# \1  # Template: Customize with your module", content)
 
 
-def update_documentation_files(old_name: str, new_name: str, root: Path) -> None:
-    """Update import examples in documentation files."""
-    print("\nUpdating documentation files...")
-
-    doc_files = [
-        root / "docs" / "architecture.md",
-        root / "docs" / "how-to" / "extend-observability-provider.md",
-        root / "CONTRIBUTING.md",
-    ]
-
-    for doc_file in doc_files:
-        if not doc_file.exists():
-            print(f"  Warning: {doc_file} not found, skipping")
-            continue
-
-        content = doc_file.read_text()
-
+def documentation_patterns(old_name: str, new_name: str) -> list[tuple[re.Pattern[str], str]]:
+    """Compile the rewrites for import examples and references in documentation."""
+    return [
         # Update import statements and package references
-        content = re.sub(rf"\bfrom {old_name}\b", f"from {new_name}", content)
-
-        content = re.sub(rf"\bimport {old_name}\b", f"import {new_name}", content)
-
+        (re.compile(rf"\bfrom {re.escape(old_name)}\b"), f"from {new_name}"),
+        (re.compile(rf"\bimport {re.escape(old_name)}\b"), f"import {new_name}"),
         # Update path references
-        content = re.sub(rf"\bsrc/{old_name}/", f"src/{new_name}/", content)
-
+        (re.compile(rf"\bsrc/{re.escape(old_name)}/"), f"src/{new_name}/"),
         # Update package name with dashes
-        content = re.sub(r"\bobservable-agent-starter\b", new_name.replace("_", "-"), content)
-
-        doc_file.write_text(content)
-        print(f"  Updated: {doc_file.relative_to(root)}")
-
+        (DASHED_NAME_WORD_RE, new_name.replace("_", "-")),
+    ]
 
-def update_init_docstring(new_name: str, root: Path) -> None:
-    """Update package docstring in __init__.py."""
-    print("\nUpdating __init__.py docstring...")
 
-    init_path = root / "src" / new_name / "__init__.py"
-    if not init_path.exists():
-        print(f"  Warning: {init_path} not found, skipping")
-        return
+def apply_patterns(content: str, patterns: list[tuple[re.Pattern[str], str]]) -> str:
+    """Apply compiled `(pattern, replacement)` pairs in order."""
+    for pattern, replacement in patterns:
+        content = pattern.sub(replacement, content)
+    return content
 
-    content = init_path.read_text()
 
-    # Update docstring to be generic
-    content = re.sub(
-        r'"""Observable Agent Starter - DSPy agent framework with observability\."""',
-        f'"""{new_name} - LLM agent with Langfuse observability."""',
-        content,
+def example_pyproject_content(content: str) -> str:
+    """Comment out the parent package dependency with install instructions."""
+    # Cheap substring probe: skip the regex when the dependency line is already gone
+    if EXAMPLE_DEPENDENCY not in content:
+        return content
+    return EXAMPLE_DEPENDENCY_RE.sub(
+        r"\1# Parent package dependency - install with: pip install -e ../..", content
     )
 
-    init_path.write_text(content)
-    print(f"  Updated: {init_path.relative_to(root)}")
-
-
-def update_example_dependencies(new_name: str, root: Path) -> None:
-    """Update example pyproject.toml dependencies - comment out with install instructions."""
-    print("\nUpdating example dependencies...")
-
-    example_pyprojects = [
-        root / "examples" / "coding_agent" / "pyproject.toml",
-        root / "examples" / "influencer_assistant" / "pyproject.toml",
-    ]
 
-    for pyproject in example_pyprojects:
-        if not pyproject.exists():
-            print(f"  Warning: {pyproject} not found, skipping")
-            continue
+def build_handlers(
+    old_name: str, new_name: str, author: str, email: str, description: str
+) -> dict[str, list[Callable[[str], str]]]:
+    """Map root-relative POSIX paths to the content transforms applied to them."""
+    docs = partial(apply_patterns, patterns=documentation_patterns(old_name, new_name))
+    example_deps = [example_pyproject_content]
+
+    return {
+        "pyproject.toml": [
+            partial(
+                pyproject_content,
+                new_name=new_name,
+                author=author,
+                email=email,
+                description=description,
+            )
+        ],
+        ".github/workflows/ci.yml": [partial(ci_workflow_content, new_name=new_name)],
+        "README.md": [partial(readme_content, new_name=new_name, author=author)],
+        f"src/{new_name}/__init__.py": [partial(init_content, new_name=new_name)],
+        f"src/{new_name}/cli.py": [partial(cli_content, new_name=new_name)],
+        "Makefile": [partial(makefile_content, new_name=new_name)],
+        "docs/architecture.md": [docs],
+        "docs/how-to/extend-observability-provider.md": [docs],
+        "CONTRIBUTING.md": [docs],
+        "examples/coding_agent/pyproject.toml": example_deps,
+        "examples/influencer_assistant/pyproject.toml": example_deps,
+    }
+
+
+def customize_file(
+    file_path: Path,
+    old_name: str,
+    new_name: str,
+    is_python: bool,
+    transforms: list[Callable[[str], str]],
+) -> bool:
+    """Apply the import rewrite and `transforms` to one file; return whether it changed."""
+    original = content = file_path.read_text()
+    if is_python:
+        content = rewrite_imports(content, old_name, new_name)
+    for transform in transforms:
+        content = transform(content)
+    return write_if_changed(file_path, original, content)
+
+
+def customize_files(
+    root: Path, old_name: str, new_name: str, handlers: dict[str, list[Callable[[str], str]]]
+) -> None:
+    """Rewrite imports and project files found in a single walk over the tree.
 
-        content = pyproject.read_text()
+    Every `.py` file gets its imports updated; files listed in `handlers` also get
+    their specific transforms. Each file is read once and only written if one of
+    the transforms actually changed it, so re-runs are cheap no-ops. Files are
+    independent, so they are processed on a thread pool to overlap their I/O.
+    """
+    log("\nUpdating project files...")
 
-        # Comment out observable-agent-starter dependency with instructions
-        content = re.sub(
-            r'(\s+)"observable-agent-starter",',
-            r"\1# Parent package dependency - install with: pip install -e ../..",
-            content,
+    # Directories to exclude
+    exclude_dirs = {".git", ".venv", "venv", "__pycache__", ".pytest_cache", "node_modules", ".tox"}
+    missing = set(handlers)
+    jobs: list[tuple[str, Path, bool, list[Callable[[str], str]]]] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune excluded directories in place so the walk never descends into them
+        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+
+        for filename in filenames:
+            rel_path = filename if rel_dir == "." else f"{rel_dir}/{filename}"
+            is_python = filename.endswith(".py")
+            transforms = handlers.get(rel_path, [])
+            if not (is_python or transforms):
+                continue
+            missing.discard(rel_path)
+            jobs.append((rel_path, Path(dirpath, filename), is_python, transforms))
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        changed = list(
+            executor.map(
+                lambda job: customize_file(job[1], old_name, new_name, job[2], job[3]), jobs
+            )
         )
 
-        pyproject.write_text(content)
-        print(f"  Updated: {pyproject.relative_to(root)}")
+    # Report in walk order regardless of which worker finished first
+    updated = 0
+    for (rel_path, *_), was_changed in zip(jobs, changed):
+        if was_changed:
+            log(f"  Updated: {rel_path}")
+            updated += 1
+
+    # Re-running on an already customized tree rewrites nothing; say so explicitly
+    if not updated:
+        log("  No changes")
+    for rel_path in sorted(missing):
+        log(f"  Warning: {root / rel_path} not found, skipping")
 
 
 def create_env_example(root: Path) -> None:
@@ -338,7 +347,7 @@ def create_env_example(root: Path) -> None:
     if env_example.exists():
         return
 
-    print("\nCreating .env.example...")
+    log("\nCreating .env.example...")
     env_example.write_text("""# OpenAI Configuration
 OPENAI_API_KEY=your-api-key-here
 OPENAI_BASE_URL=https://api.openai.com/v1
@@ -349,25 +358,11 @@ LANGFUSE_PUBLIC_KEY=your-public-key
 LANGFUSE_SECRET_KEY=your-secret-key
 LANGFUSE_HOST=https://cloud.langfuse.com
 """)
-    print("  Created: .env.example")
-
-
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Customize the Observable Agent Starter template for your project"
-    )
-    parser.add_argument(
-        "--name",
-        required=True,
-        help="New project name (lowercase, underscores allowed, e.g., 'my_project')",
-    )
-    parser.add_argument("--author", required=True, help="Your name or GitHub username")
-    parser.add_argument("--email", required=True, help="Your email address")
-    parser.add_argument("--description", default="", help="Project description (optional)")
+    log("  Created: .env.example")
 
-    args = parser.parse_args(argv)
 
+def customize(args: argparse.Namespace) -> int:
+    """Run the customization steps for parsed command line arguments."""
     # Validate project name
     if not validate_project_name(args.name):
         return 1
@@ -378,16 +373,17 @@ def main(argv: list[str] | None = None) -> int:
     root = get_project_root()
     old_name = "observable_agent_starter"
 
-    print("\nCustomizing Observable Agent Starter template")
-    print(f"  New project name: {args.name}")
-    print(f"  Author: {args.author} <{args.email}>")
-    print(f"  Description: {description}")
-    print()
+    log("\nCustomizing Observable Agent Starter template")
+    log(f"  New project name: {args.name}")
+    log(f"  Author: {args.author} <{args.email}>")
+    log(f"  Description: {description}")
+    log()
+    flush_log()
 
     # Confirm before proceeding
     response = input("Proceed with customization? [y/N]: ")
     if response.lower() != "y":
-        print("Cancelled.")
+        log("Cancelled.")
         return 1
 
     try:
@@ -395,56 +391,56 @@ def main(argv: list[str] | None = None) -> int:
         if not rename_package_directory(old_name, args.name, root):
             return 1
 
-        # Step 2: Update all imports
-        update_all_imports(old_name, args.name, root)
-
-        # Step 3: Update pyproject.toml
-        update_pyproject_toml(args.name, args.author, args.email, description, root)
-
-        # Step 4: Update CI workflow
-        update_ci_workflow(args.name, root)
-
-        # Step 5: Update README
-        update_readme(args.name, args.author, root)
+        # Step 2: Update imports, project metadata, CI, README, Makefile, docs and
+        # example dependencies in a single pass over the tree
+        handlers = build_handlers(old_name, args.name, args.author, args.email, description)
+        customize_files(root, old_name, args.name, handlers)
 
-        # Step 6: Update __init__.py version and docstring
-        update_init_version(args.name, root)
-        update_init_docstring(args.name, root)
-
-        # Step 7: Update CLI prog name
-        update_cli(args.name, root)
-
-        # Step 8: Update Makefile
-        update_makefile(args.name, root)
-
-        # Step 9: Update documentation files
-        update_documentation_files(old_name, args.name, root)
-
-        # Step 10: Update example dependencies
-        update_example_dependencies(args.name, root)
-
-        # Step 11: Create .env.example
+        # Step 3: Create .env.example
         create_env_example(root)
 
-        print("\nCustomization complete!")
-        print("\nNext steps:")
-        print("  1. Review changes: git diff")
-        print("  2. Update README.md with your project description")
-        print("  3. Copy .env.example to .env and add your API keys")
-        print("  4. Install: make dev")
-        print("  5. Test: make test")
-        print(f"  6. Verify CLI works: {args.name} --version")
-        print("  7. Commit: git add . && git commit -m 'chore: customize template'")
+        log("\nCustomization complete!")
+        log("\nNext steps:")
+        log("  1. Review changes: git diff")
+        log("  2. Update README.md with your project description")
+        log("  3. Copy .env.example to .env and add your API keys")
+        log("  4. Install: make dev")
+        log("  5. Test: make test")
+        log(f"  6. Verify CLI works: {args.name} --version")
+        log("  7. Commit: git add . && git commit -m 'chore: customize template'")
 
         return 0
 
     except Exception as e:
-        print(f"\nError during customization: {e}")
+        log(f"\nError during customization: {e}")
+        flush_log()
         import traceback
 
         traceback.print_exc()
         return 1
 
 
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Customize the Observable Agent Starter template for your project"
+    )
+    parser.add_argument(
+        "--name",
+        required=True,
+        help="New project name (lowercase, underscores allowed, e.g., 'my_project')",
+    )
+    parser.add_argument("--author", required=True, help="Your name or GitHub username")
+    parser.add_argument("--email", required=True, help="Your email address")
+    parser.add_argument("--description", default="", help="Project description (optional)")
+
+    args = parser.parse_args(argv)
+
+    try:
+        return customize(args)
+    finally:
+        flush_log()
+
+
 if __name__ == "__main__":
     sys.exit(main())
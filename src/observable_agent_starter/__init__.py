@@ -2,8 +2,35 @@
 
 __version__ = "0.3.0"
 
-from .observability import ObservabilityProvider, create_observability
-from .config import configure_lm_from_env, log_langfuse_generation
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .observability import ObservabilityProvider, create_observability
+    from .config import configure_lm_from_env, log_langfuse_generation
+
+# Public names are imported on first access, so importing the package (e.g. for
+# `observable-agent --version`) does not pull in DSPy and Langfuse.
+_EXPORTS = {
+    "ObservabilityProvider": ".observability",
+    "create_observability": ".observability",
+    "configure_lm_from_env": ".config",
+    "log_langfuse_generation": ".config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "ObservabilityProvider",
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+from collections.abc import Iterable, Iterator
 from typing import Any, Dict, Optional, TYPE_CHECKING
 from pathlib import Path
 
@@ -19,15 +21,33 @@ else:
 
 LOGGER = logging.getLogger(__name__)
 _LANGFUSE_CLIENT: Optional[Langfuse] = None
+_DOTENV_LOADED = False
+# KEY=VALUE with optional surrounding whitespace; comments and blanks never match
+_DOTENV_LINE_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
 
+# Resolved once: older DSPy versions only expose settings as attributes.
+_SETTINGS_GET = getattr(dspy.settings, "get", None)
 
-def _load_dotenv_into_env() -> None:
-    """Best-effort .env loader without adding a dependency.
 
-    - Looks for a `.env` in CWD and up to three parent directories.
-    - Parses simple KEY=VALUE lines, ignoring blanks and comments.
-    - Does not override variables that are already set in `os.environ`.
-    """
+def _current_lm() -> Any:
+    """Return the LM visible in DSPy settings, checking both access patterns."""
+
+    lm = _SETTINGS_GET("lm") if _SETTINGS_GET is not None else None
+    if lm is None:
+        lm = getattr(dspy.settings, "lm", None)
+    return lm
+
+
+def _reset_state() -> None:
+    """Forget the cached Langfuse client and `.env` scan (used by tests)."""
+
+    global _LANGFUSE_CLIENT, _DOTENV_LOADED
+    _LANGFUSE_CLIENT = None
+    _DOTENV_LOADED = False
+
+
+def _dotenv_lines() -> Iterator[str]:
+    """Yield the lines of every `.env` in CWD and up to three parent directories."""
 
     candidates = []
     try:
@@ -42,17 +62,32 @@ def _load_dotenv_into_env() -> None:
         try:
             if not env_path.exists():
                 continue
-            for raw in env_path.read_text().splitlines():
-                line = raw.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip()
-                if key and key not in os.environ:
-                    os.environ[key] = value
+            lines = env_path.read_text().splitlines()
+        except Exception:  # nosec B112
+            # Unreadable files are skipped like missing ones
+            continue
+        yield from lines
+
+
+def _load_dotenv_into_env(lines: Optional[Iterable[str]] = None) -> None:
+    """Best-effort .env loader without adding a dependency.
+
+    - Reads `lines` if given, otherwise the `.env` files found by `_dotenv_lines`.
+    - Parses simple KEY=VALUE lines, ignoring blanks and comments.
+    - Does not override variables that are already set in `os.environ`.
+    """
+
+    if lines is None:
+        lines = _dotenv_lines()
+
+    for raw in lines:
+        try:
+            match = _DOTENV_LINE_RE.match(raw)
+            if match is None:
+                continue
+            key, value = match.groups()
+            if key not in os.environ:
+                os.environ[key] = value.strip('"').strip()
         except Exception:  # nosec B112
             # Never crash on dotenv parsing - intentionally skip malformed lines
             continue
@@ -62,17 +97,19 @@ def configure_lm_from_env() -> bool:
     """Configure DSPy to use an LM if `OPENAI_*` environment variables are set.
 
     Supports both `dspy.settings.configure(...)` and `dspy.configure(...)` APIs,
-    and validates that the LM is actually visible after configuration.
+    and validates that the LM is actually visible after configuration. Cheap to
+    call repeatedly: `.env` is only scanned on the first call per process.
     """
 
+    global _DOTENV_LOADED
+
     # Load .env if present so local runs (e.g., make targets) pick up keys
-    _load_dotenv_into_env()
+    if not _DOTENV_LOADED:
+        _load_dotenv_into_env()
+        _DOTENV_LOADED = True
 
     # Already configured?
-    existing = getattr(dspy.settings, "get", lambda *_: None)("lm")
-    if existing is None:
-        existing = getattr(dspy.settings, "lm", None)
-    if existing is not None:
+    if _current_lm() is not None:
         return True
 
     api_key = os.getenv("OPENAI_API_KEY")
@@ -112,11 +149,7 @@ def configure_lm_from_env() -> bool:
         configured = False
 
     # Validate visibility via both access patterns
-    check = getattr(dspy.settings, "get", lambda *_: None)("lm")
-    if check is None:
-        check = getattr(dspy.settings, "lm", None)
-
-    if configured and check is not None:
+    if configured and _current_lm() is not None:
         LOGGER.info("Configured DSPy LM with model %s", model)
         return True
 
@@ -129,13 +162,14 @@ def configure_langfuse_from_env() -> Optional[Langfuse]:
 
     global _LANGFUSE_CLIENT
 
+    # Fast path for repeat calls (e.g. every log_langfuse_generation)
+    if _LANGFUSE_CLIENT is not None:
+        return _LANGFUSE_CLIENT
+
     if Langfuse is None:
         LOGGER.debug("langfuse package not available; skipping Langfuse setup")
         return None
 
-    if _LANGFUSE_CLIENT is not None:
-        return _LANGFUSE_CLIENT
-
     public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
     secret_key = os.getenv("LANGFUSE_SECRET_KEY")
     if not (public_key and secret_key):
@@ -173,7 +207,7 @@ def log_langfuse_generation(
         return
 
     try:
-        model = getattr(getattr(dspy.settings, "lm", None), "model", None)
+        model = getattr(_current_lm(), "model", None)
         observation = client.start_observation(
             name=name,
             as_type="generation",
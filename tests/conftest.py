@@ -0,0 +1,37 @@
+"""Shared fixtures for the core test suite."""
+
+import dspy
+import pytest
+
+from observable_agent_starter import config
+
+
+class FakeLM:
+    """Stand-in for `dspy.LM` that records its arguments instead of resolving a model."""
+
+    def __init__(self, model, **kwargs):
+        self.model = model
+        self.kwargs = kwargs
+
+
+@pytest.fixture(autouse=True)
+def fake_lm(monkeypatch):
+    """Replace `dspy.LM` so no test can build a client that reaches the network.
+
+    Tests only exercise configuration, so the "API key set" paths never need a
+    real LM; requesting this fixture gives access to the stand-in class.
+    """
+    monkeypatch.setattr(config.dspy, "LM", FakeLM)
+    return FakeLM
+
+
+@pytest.fixture(autouse=True)
+def reset_dspy():
+    """Reset DSPy settings and config module state after each test.
+
+    Resetting on teardown only is enough: every test leaves the state clean
+    for the next one, so the pre-test reset was redundant work.
+    """
+    yield
+    dspy.settings.configure(lm=None)
+    config._reset_state()
@@ -6,25 +6,25 @@ from observable_agent_starter import __version__
 from observable_agent_starter.cli import main
 
 
-def test_cli_version(capsys):
-    """Test --version flag displays version and exits successfully."""
-    with pytest.raises(SystemExit) as exc_info:
-        main(["--version"])
-
-    assert exc_info.value.code == 0
-    captured = capsys.readouterr()
-    assert __version__ in captured.out
-
-
-def test_cli_default_behavior(capsys):
-    """Test default CLI behavior with no arguments."""
-    result = main([])
-
-    assert result == 0
+@pytest.mark.parametrize(
+    ("argv", "substrings"),
+    [
+        # --version prints and exits through argparse's SystemExit(0)
+        pytest.param(["--version"], [__version__], id="version"),
+        pytest.param([], ["observable-agent", __version__, "Ready"], id="default"),
+    ],
+)
+def test_cli_invocation(capsys, argv, substrings):
+    """CLI invocations should exit successfully and print the expected output."""
+    try:
+        code = main(argv)
+    except SystemExit as exc:
+        code = exc.code
+
+    assert code == 0
     captured = capsys.readouterr()
-    assert "observable-agent" in captured.out
-    assert __version__ in captured.out
-    assert "Ready" in captured.out
+    for substring in substrings:
+        assert substring in captured.out
 
 
 def test_cli_main_entrypoint():
@@ -5,14 +5,13 @@ import dspy
 from observable_agent_starter import config
 
 
-@pytest.fixture(autouse=True)
-def reset_dspy():
-    """Reset DSPy settings before each test."""
-    dspy.settings.configure(lm=None)
-    config._LANGFUSE_CLIENT = None  # type: ignore[attr-defined]
-    yield
-    dspy.settings.configure(lm=None)
-    config._LANGFUSE_CLIENT = None  # type: ignore[attr-defined]
+def _set_env(monkeypatch, **env):
+    """Set several environment variables at once; `None` values are removed."""
+    for name, value in env.items():
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+        else:
+            monkeypatch.setenv(name, value)
 
 
 def test_configure_lm_from_env_without_key(monkeypatch):
@@ -23,41 +22,131 @@ def test_configure_lm_from_env_without_key(monkeypatch):
     result = config.configure_lm_from_env()
 
     assert result is False
-    lm = dspy.settings.get("lm") if hasattr(dspy.settings, "get") else None
-    if lm is None:
-        lm = getattr(dspy.settings, "lm", None)
+    lm = config._current_lm()
     assert lm is None
 
 
-def test_configure_lm_from_env_with_key(monkeypatch):
-    """Should configure LM when API key is set."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("OPENAI_MODEL", "openai/test-model")
+@pytest.mark.parametrize(
+    ("env", "expected_kwargs"),
+    [
+        pytest.param({"OPENAI_MODEL": "openai/test-model"}, {}, id="with_key"),
+        pytest.param(
+            {"OPENAI_BASE_URL": "https://custom.openai.com"},
+            {"base_url": "https://custom.openai.com"},
+            id="with_base_url",
+        ),
+        pytest.param(
+            {"OPENAI_TEMPERATURE": "0.7"}, {"temperature": 0.7}, id="with_valid_temperature"
+        ),
+        # Invalid temperature is ignored, but the LM is still configured
+        pytest.param({"OPENAI_TEMPERATURE": "not-a-number"}, {}, id="with_invalid_temperature"),
+    ],
+)
+def test_configure_lm_from_env_with_key(monkeypatch, fake_lm, env, expected_kwargs):
+    """Should configure LM when API key is set, passing through optional settings."""
+    monkeypatch.setattr(config, "_load_dotenv_into_env", lambda: None)
+    unset = {"OPENAI_MODEL": None, "OPENAI_BASE_URL": None, "OPENAI_TEMPERATURE": None}
+    _set_env(monkeypatch, OPENAI_API_KEY="test-key", **{**unset, **env})
 
     result = config.configure_lm_from_env()
 
     assert result is True
-    lm = dspy.settings.get("lm") if hasattr(dspy.settings, "get") else None
-    if lm is None:
-        lm = getattr(dspy.settings, "lm", None)
-    assert lm is not None
+    lm = config._current_lm()
+    assert isinstance(lm, fake_lm)
+    assert lm.kwargs == {"api_key": "test-key", **expected_kwargs}
 
 
-def test_configure_lm_from_env_is_idempotent(monkeypatch):
-    """Should not reconfigure if already configured."""
+def test_configure_lm_from_env_is_idempotent(monkeypatch, fake_lm):
+    """Should not reconfigure (or rebuild the LM) if already configured."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    built = []
+
+    class CountingLM(fake_lm):
+        def __init__(self, model, **kwargs):
+            super().__init__(model, **kwargs)
+            built.append(self)
+
+    monkeypatch.setattr(config.dspy, "LM", CountingLM)
 
     result1 = config.configure_lm_from_env()
     result2 = config.configure_lm_from_env()
 
     assert result1 is True
     assert result2 is True
+    assert len(built) == 1
+
+
+def test_configure_lm_from_env_loads_dotenv_once(monkeypatch):
+    """Repeat calls should not rescan .env files."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    calls = []
+    monkeypatch.setattr(config, "_load_dotenv_into_env", lambda: calls.append(1))
+
+    config.configure_lm_from_env()
+    config.configure_lm_from_env()
+
+    assert len(calls) == 1
+
+
+class MockObservation:
+    def __init__(self):
+        self.output = None
+
+    def update(self, output):
+        self.output = output
+
+    def end(self):
+        pass
+
+
+class MockLangfuse:
+    def __init__(self, public_key, secret_key, host):
+        self.public_key = public_key
+        self.secret_key = secret_key
+        self.host = host
+        self.observations = []
+
+    def start_observation(self, name, as_type, input, output, metadata, model):
+        obs = MockObservation()
+        self.observations.append(
+            {
+                "name": name,
+                "type": as_type,
+                "input": input,
+                "output": output,
+                "metadata": metadata,
+                "model": model,
+            }
+        )
+        return obs
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def mock_langfuse(monkeypatch) -> type[MockLangfuse]:
+    """Make `configure_langfuse_from_env` build in-memory `MockLangfuse` clients."""
+    monkeypatch.setattr(config, "Langfuse", MockLangfuse)
+    return MockLangfuse
+
+
+@pytest.fixture
+def langfuse_client(monkeypatch, mock_langfuse, fake_lm):
+    """A configured `MockLangfuse` client, with an LM that has a model name."""
+    _set_env(
+        monkeypatch,
+        LANGFUSE_PUBLIC_KEY="pk",
+        LANGFUSE_SECRET_KEY="sk",
+        LANGFUSE_HOST="https://test.com",
+    )
+    dspy.settings.configure(lm=fake_lm("test-model"))
+    return config.configure_langfuse_from_env()
 
 
 def test_configure_langfuse_without_creds(monkeypatch):
     """Should return None when credentials are missing."""
-    monkeypatch.delenv("LANGFUSE_PUBLIC_KEY", raising=False)
-    monkeypatch.delenv("LANGFUSE_SECRET_KEY", raising=False)
+    _set_env(monkeypatch, LANGFUSE_PUBLIC_KEY=None, LANGFUSE_SECRET_KEY=None)
 
     client = config.configure_langfuse_from_env()
 
@@ -88,52 +177,40 @@ def test_load_dotenv_with_valid_env_file(tmp_path, monkeypatch):
     assert config.os.environ["TEST_KEY"] == "test_value"
 
 
-def test_load_dotenv_with_comments_and_blanks(tmp_path, monkeypatch):
-    """Should ignore comments and blank lines in .env."""
-    env_file = tmp_path / ".env"
-    env_file.write_text("""
-# This is a comment
-TEST_KEY=test_value
-
-# Another comment
-ANOTHER_KEY=another_value
-    """)
-
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("TEST_KEY", raising=False)
-
-    config._load_dotenv_into_env()
-
-    assert config.os.environ.get("TEST_KEY") == "test_value"
-
-
-def test_load_dotenv_with_invalid_lines(tmp_path, monkeypatch):
-    """Should skip lines without = sign."""
-    env_file = tmp_path / ".env"
-    env_file.write_text("""
-VALID_KEY=valid_value
-INVALID_LINE_WITHOUT_EQUALS
-ANOTHER_VALID=another_value
-    """)
-
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("VALID_KEY", raising=False)
-
-    config._load_dotenv_into_env()
-
-    assert config.os.environ.get("VALID_KEY") == "valid_value"
-    assert config.os.environ.get("ANOTHER_VALID") == "another_value"
-
-
-def test_load_dotenv_doesnt_override_existing_env(tmp_path, monkeypatch):
+@pytest.mark.parametrize(
+    ("lines", "expected"),
+    [
+        pytest.param(
+            ["", "# This is a comment", "TEST_KEY=test_value", "", "# Another comment", "    "],
+            {"TEST_KEY": "test_value"},
+            id="comments_and_blanks",
+        ),
+        pytest.param(
+            ["VALID_KEY=valid_value", "INVALID_LINE_WITHOUT_EQUALS", "ANOTHER_VALID=another"],
+            {"VALID_KEY": "valid_value", "ANOTHER_VALID": "another"},
+            id="invalid_lines",
+        ),
+        pytest.param(
+            ['  QUOTED = "quoted value"  ', "EMPTY=", "URL=https://x.test/?a=b"],
+            {"QUOTED": "quoted value", "EMPTY": "", "URL": "https://x.test/?a=b"},
+            id="quotes_whitespace_and_equals_in_value",
+        ),
+    ],
+)
+def test_load_dotenv_parses_lines(monkeypatch, lines, expected):
+    """Should load KEY=VALUE lines and skip comments, blanks and lines without = sign."""
+    monkeypatch.setattr(config.os, "environ", {})
+
+    config._load_dotenv_into_env(lines)
+
+    assert config.os.environ == expected
+
+
+def test_load_dotenv_doesnt_override_existing_env(monkeypatch):
     """Should not override existing environment variables."""
-    env_file = tmp_path / ".env"
-    env_file.write_text("EXISTING_KEY=new_value")
-
-    monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("EXISTING_KEY", "existing_value")
 
-    config._load_dotenv_into_env()
+    config._load_dotenv_into_env(["EXISTING_KEY=new_value"])
 
     assert config.os.environ["EXISTING_KEY"] == "existing_value"
 
@@ -146,143 +223,61 @@ def test_load_dotenv_handles_nonexistent_file(tmp_path, monkeypatch):
     config._load_dotenv_into_env()
 
 
-def test_configure_lm_with_base_url(monkeypatch):
-    """Should configure LM with custom base URL."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("OPENAI_BASE_URL", "https://custom.openai.com")
-
-    result = config.configure_lm_from_env()
-
-    assert result is True
-
-
-def test_configure_lm_with_valid_temperature(monkeypatch):
-    """Should configure LM with valid temperature."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("OPENAI_TEMPERATURE", "0.7")
-
-    result = config.configure_lm_from_env()
-
-    assert result is True
-
-
-def test_configure_lm_with_invalid_temperature(monkeypatch):
-    """Should ignore invalid temperature value."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("OPENAI_TEMPERATURE", "not-a-number")
-
-    result = config.configure_lm_from_env()
-
-    assert result is True  # Should still configure, just ignore temperature
-
-
-def test_configure_langfuse_with_custom_host(monkeypatch):
+def test_configure_langfuse_with_custom_host(monkeypatch, mock_langfuse):
     """Should configure Langfuse with custom host."""
-    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "test-public")
-    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "test-secret")
-    monkeypatch.setenv("LANGFUSE_HOST", "https://custom.langfuse.com")
-
-    # Mock Langfuse to avoid actual connection
-    class MockLangfuse:
-        def __init__(self, public_key, secret_key, host):
-            self.public_key = public_key
-            self.secret_key = secret_key
-            self.host = host
-
-    monkeypatch.setattr(config, "Langfuse", MockLangfuse)
+    _set_env(
+        monkeypatch,
+        LANGFUSE_PUBLIC_KEY="test-public",
+        LANGFUSE_SECRET_KEY="test-secret",
+        LANGFUSE_HOST="https://custom.langfuse.com",
+    )
 
     client = config.configure_langfuse_from_env()
 
-    assert client is not None
-    assert client.host == "https://custom.langfuse.com"  # type: ignore[attr-defined]
+    assert isinstance(client, MockLangfuse)
+    assert client.host == "https://custom.langfuse.com"
 
 
-def test_configure_langfuse_uses_default_host(monkeypatch):
+def test_configure_langfuse_uses_default_host(monkeypatch, mock_langfuse):
     """Should use default Langfuse host when not specified."""
-    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "test-public")
-    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "test-secret")
-    monkeypatch.delenv("LANGFUSE_HOST", raising=False)
-
-    class MockLangfuse:
-        def __init__(self, public_key, secret_key, host):
-            self.host = host
-
-    monkeypatch.setattr(config, "Langfuse", MockLangfuse)
+    _set_env(
+        monkeypatch,
+        LANGFUSE_PUBLIC_KEY="test-public",
+        LANGFUSE_SECRET_KEY="test-secret",
+        LANGFUSE_HOST=None,
+    )
 
     client = config.configure_langfuse_from_env()
 
-    assert client is not None
-    assert client.host == "https://cloud.langfuse.com"  # type: ignore[attr-defined]
+    assert isinstance(client, MockLangfuse)
+    assert client.host == "https://cloud.langfuse.com"
 
 
-def test_configure_langfuse_is_singleton(monkeypatch):
+def test_configure_langfuse_is_singleton(monkeypatch, mock_langfuse):
     """Should return the same Langfuse client on repeated calls."""
-    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "test-public")
-    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "test-secret")
-
-    class MockLangfuse:
-        def __init__(self, public_key, secret_key, host):
-            pass
-
-    monkeypatch.setattr(config, "Langfuse", MockLangfuse)
+    _set_env(monkeypatch, LANGFUSE_PUBLIC_KEY="test-public", LANGFUSE_SECRET_KEY="test-secret")
 
     client1 = config.configure_langfuse_from_env()
     client2 = config.configure_langfuse_from_env()
 
+    assert isinstance(client1, MockLangfuse)
     assert client1 is client2
 
 
-def test_log_langfuse_generation_with_metadata(monkeypatch):
+@pytest.mark.parametrize("metadata", [{"key": "value"}, None], ids=["metadata", "no_metadata"])
+def test_log_langfuse_generation_with_metadata(langfuse_client, metadata):
     """Should log generation with metadata to Langfuse."""
-
-    class MockObservation:
-        def __init__(self):
-            self.output = None
-
-        def update(self, output):
-            self.output = output
-
-        def end(self):
-            pass
-
-    class MockLangfuse:
-        def __init__(self, public_key, secret_key, host):
-            self.observations = []
-
-        def start_observation(self, name, as_type, input, output, metadata, model):
-            obs = MockObservation()
-            self.observations.append(
-                {
-                    "name": name,
-                    "type": as_type,
-                    "input": input,
-                    "output": output,
-                    "metadata": metadata,
-                    "model": model,
-                }
-            )
-            return obs
-
-        def flush(self):
-            pass
-
-    mock_client = MockLangfuse("pk", "sk", "https://test.com")
-    monkeypatch.setattr(config, "configure_langfuse_from_env", lambda: mock_client)
-
-    # Configure DSPy with a mock LM that has a model attribute
-    class MockLM:
-        model = "test-model"
-
-    dspy.settings.configure(lm=MockLM())
-
     config.log_langfuse_generation(
         name="test-generation",
         input_text="test input",
         output_payload={"result": "test output"},
-        metadata={"key": "value"},
+        metadata=metadata,
     )
 
-    assert len(mock_client.observations) == 1
-    obs = mock_client.observations[0]
+    assert len(langfuse_client.observations) == 1
+    obs = langfuse_client.observations[0]
     assert obs["name"] == "test-generation"
-    assert obs["metadata"] == {"key": "value"}
+    assert obs["type"] == "generation"
+    assert obs["input"] == {"ticket": "test input"}
+    assert obs["metadata"] == metadata
+    assert obs["model"] == "test-model"
@@ -1,18 +1,8 @@
 """Tests for ObservabilityProvider."""
 
 import pytest
-import dspy
-from observable_agent_starter import ObservabilityProvider, create_observability, config
-
 
-@pytest.fixture(autouse=True)
-def reset_dspy():
-    """Reset DSPy settings before each test."""
-    dspy.settings.configure(lm=None)
-    config._LANGFUSE_CLIENT = None  # type: ignore[attr-defined]
-    yield
-    dspy.settings.configure(lm=None)
-    config._LANGFUSE_CLIENT = None  # type: ignore[attr-defined]
+from observable_agent_starter import ObservabilityProvider, create_observability, config
 
 
 def test_observability_provider_initialization():
@@ -31,9 +21,7 @@ def test_create_observability_auto_configures_lm(monkeypatch):
     provider = create_observability("test-agent")
 
     assert provider.observation_name == "test-agent"
-    lm = dspy.settings.get("lm") if hasattr(dspy.settings, "get") else None
-    if lm is None:
-        lm = getattr(dspy.settings, "lm", None)
+    lm = config._current_lm()
     assert lm is not None
 
 
@@ -45,9 +33,7 @@ def test_create_observability_without_lm_configuration(monkeypatch):
     provider = create_observability("test-agent", configure_lm=False)
 
     assert provider.observation_name == "test-agent"
-    lm = dspy.settings.get("lm") if hasattr(dspy.settings, "get") else None
-    if lm is None:
-        lm = getattr(dspy.settings, "lm", None)
+    lm = config._current_lm()
     assert lm is None
 
 
@@ -92,6 +78,7 @@ def test_log_generation_helper(monkeypatch):
     assert calls[0]["metadata"]["custom_meta"] == "value"
 
 
+@pytest.mark.slow
 def test_observability_provider_composition_pattern():
     """ObservabilityProvider should work with composition pattern."""
     import dspy